@@ -8,18 +8,42 @@ Supports SDG1000, SDG2000X, and SDG6000X series instruments.
 @author: Extended by Function Generator UI Project
 """
 
-from visa_instruments import VisaInstruments
-from sdg1000.sdg1000_instrument import SDG1000
-from sdg2000x.sdg2000x_instrument import SDG2000X
-from factory import SiglentInstrumentFactory, UnsupportedModelError, create_siglent_instrument, detect_siglent_model
+import importlib
 
 __version__ = "0.1.0"
 __all__ = [
     'VisaInstruments',
-    'SDG1000', 
+    'AsyncVisaInstruments',
+    'SDG1000',
     'SDG2000X',
     'SiglentInstrumentFactory',
     'UnsupportedModelError',
     'create_siglent_instrument',
     'detect_siglent_model'
 ]
+
+# Re-exports resolved lazily (PEP 562) so importing the package does not
+# eagerly pull pyvisa and both instrument modules
+_LAZY_EXPORTS = {
+    'VisaInstruments': 'visa_instruments',
+    'AsyncVisaInstruments': 'visa_instruments_async',
+    'SDG1000': 'sdg1000.sdg1000_instrument',
+    'SDG2000X': 'sdg2000x.sdg2000x_instrument',
+    'SiglentInstrumentFactory': 'factory',
+    'UnsupportedModelError': 'factory',
+    'create_siglent_instrument': 'factory',
+    'detect_siglent_model': 'factory'
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
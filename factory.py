@@ -9,12 +9,18 @@ based on SCPI *IDN? response.
 @reference: Siglent API Reference, Device Documentation
 """
 
+import functools
 import re
-from typing import Union, Optional
+import sys
+from typing import TYPE_CHECKING, Union, Optional
 
-# Import instrument classes
-from sdg2000x.sdg2000x_instrument import SDG2000X
-from sdg1000.sdg1000_instrument import SDG1000
+# Instrument classes (and pyvisa, transitively) are imported lazily inside
+# the creation paths so importing this module for pure classification work
+# stays cheap
+if TYPE_CHECKING:
+    from visa_instruments import VisaInstruments
+    from sdg1000.sdg1000_instrument import SDG1000
+    from sdg2000x.sdg2000x_instrument import SDG2000X
 
 
 class UnsupportedModelError(Exception):
@@ -22,6 +28,22 @@ class UnsupportedModelError(Exception):
     pass
 
 
+# Interned family name constants: classification returns these exact objects,
+# so downstream dispatch is a single hash lookup on an interned key instead
+# of chained string comparisons
+FAM_SDG1000 = sys.intern('SDG1000')
+FAM_SDG2000X = sys.intern('SDG2000X')
+FAM_SDG6000X = sys.intern('SDG6000X')
+
+# Every supported family is determined by the four-character model prefix,
+# so classification starts with one dict lookup instead of regex work
+_PREFIX_TO_FAMILY = {
+    'SDG1': FAM_SDG1000,
+    'SDG2': FAM_SDG2000X,
+    'SDG6': FAM_SDG6000X
+}
+
+
 class SiglentInstrumentFactory:
     """
     Factory class for creating appropriate Siglent instrument instances
@@ -44,7 +66,98 @@ class SiglentInstrumentFactory:
         r'SDG6\d{3}X[A-Z]*',  # SDG6032X, etc.
         r'SDG60\d{2}X[A-Z]*'
     ]
-    
+
+    # Pre-compiled pattern objects (built once at class-body load time so the
+    # hot classification path never pays re._compile cache lookups per call)
+    # Patterns are all-uppercase ASCII, so instead of paying per-character
+    # case folding under re.IGNORECASE, callers uppercase the input once and
+    # the patterns compile case-sensitive
+    _SDG1000_RE = [re.compile(p) for p in SDG1000_PATTERNS]
+    _SDG2000X_RE = [re.compile(p) for p in SDG2000X_PATTERNS]
+    _SDG6000X_RE = [re.compile(p) for p in SDG6000X_PATTERNS]
+
+    # Single alternation over every family, dispatched on match.lastgroup,
+    # so one search replaces up to six sequential pattern invocations
+    _COMBINED_RE = re.compile(
+        '|'.join(
+            f"(?P<{family}>{'|'.join(patterns)})"
+            for family, patterns in [
+                ('SDG1000', SDG1000_PATTERNS),
+                ('SDG2000X', SDG2000X_PATTERNS),
+                ('SDG6000X', SDG6000X_PATTERNS)
+            ]
+        )
+    )
+
+    # Frozen, shareable views handed out by the accessors below — built once
+    # so no list literal is allocated per call and callers cannot mutate
+    # internal state
+    _SUPPORTED = (FAM_SDG1000, FAM_SDG2000X)
+    _PATTERN_MAP = {
+        FAM_SDG1000: tuple(SDG1000_PATTERNS),
+        FAM_SDG2000X: tuple(SDG2000X_PATTERNS),
+        FAM_SDG6000X: tuple(SDG6000X_PATTERNS)
+    }
+    _FAMILY_RE = {
+        FAM_SDG1000: _SDG1000_RE,
+        FAM_SDG2000X: _SDG2000X_RE,
+        FAM_SDG6000X: _SDG6000X_RE
+    }
+
+    # Lazily imported instrument classes, cached per family
+    _CLASS_CACHE = {}
+
+    @classmethod
+    def _instrument_class(cls, model_family: str):
+        """
+        Import and cache the instrument class for a model family
+
+        Args:
+            model_family: Model family name ('SDG1000', 'SDG2000X')
+
+        Returns:
+            type: The instrument class for the family
+        """
+        klass = cls._CLASS_CACHE.get(model_family)
+        if klass is None:
+            if model_family == FAM_SDG1000:
+                from sdg1000.sdg1000_instrument import SDG1000 as klass
+            elif model_family == FAM_SDG2000X:
+                from sdg2000x.sdg2000x_instrument import SDG2000X as klass
+            else:
+                raise UnsupportedModelError(f"No instrument class for family: {model_family}")
+            cls._CLASS_CACHE[model_family] = klass
+        return klass
+
+    @staticmethod
+    def _classify(model_name: str) -> Optional[str]:
+        """
+        Cheap prefix/digit classification of a model token
+
+        Avoids the regex engine entirely for typical IDN responses; the
+        compiled patterns remain as a fallback for unusual suffixes.
+
+        Args:
+            model_name: Model name extracted from the *IDN? response
+
+        Returns:
+            Optional[str]: Model family, or None when the fast checks are
+            inconclusive and the caller should fall back to the regex
+        """
+        m = model_name.strip().upper()
+        if len(m) < 7 or not m.startswith('SDG') or not m[3:7].isdigit():
+            return None
+
+        suffix = m[7:]
+        if m[3] == '1' and (not suffix or suffix.isalpha()):
+            return FAM_SDG1000
+        if m[3] == '2' and suffix.startswith('X') and (len(suffix) == 1 or suffix[1:].isalpha()):
+            return FAM_SDG2000X
+        if m[3] == '6' and suffix.startswith('X') and (len(suffix) == 1 or suffix[1:].isalpha()):
+            return FAM_SDG6000X
+
+        return None
+
     @classmethod
     def detect_model_from_idn(cls, idn_response: str) -> str:
         """
@@ -64,42 +177,23 @@ class SiglentInstrumentFactory:
             >>> model = factory.detect_model_from_idn("Siglent Technologies,SDG1025,SDG1XXXXXXXX,1.01.01.33R5")
             >>> print(model)  # 'SDG1000'
         """
-        if not idn_response:
-            raise UnsupportedModelError("Empty or invalid *IDN? response")
-        
-        # Extract model name from IDN response
-        # Expected format: "Manufacturer,Model,SerialNumber,FirmwareVersion"
-        parts = idn_response.strip().split(',')
-        if len(parts) < 2:
-            raise UnsupportedModelError(f"Invalid *IDN? format: {idn_response}")
-        
-        model_name = parts[1].strip()
-        
-        # Check against known patterns
-        for pattern in cls.SDG1000_PATTERNS:
-            if re.search(pattern, model_name, re.IGNORECASE):
-                return 'SDG1000'
-        
-        for pattern in cls.SDG2000X_PATTERNS:
-            if re.search(pattern, model_name, re.IGNORECASE):
-                return 'SDG2000X'
-        
-        for pattern in cls.SDG6000X_PATTERNS:
-            if re.search(pattern, model_name, re.IGNORECASE):
-                return 'SDG6000X'
-        
-        # Model not recognized
-        raise UnsupportedModelError(f"Unsupported model detected: {model_name}")
+        return _detect_model_from_idn(idn_response)
     
     @classmethod
-    def create_instrument(cls, address: str, model_hint: Optional[str] = None) -> Union[SDG1000, SDG2000X]:
+    def create_instrument(cls, address: str, model_hint: Optional[str] = None,
+                          _session: Optional['VisaInstruments'] = None,
+                          _prefetched_idn: Optional[str] = None) -> Union['SDG1000', 'SDG2000X']:
         """
         Create appropriate instrument instance with automatic model detection
-        
+
         Args:
             address: VISA resource address
             model_hint: Optional model family hint ('SDG1000', 'SDG2000X') to skip detection
-            
+            _session: Optional already-open session from _query_idn, reused
+                instead of opening a new one
+            _prefetched_idn: Optional IDN response already read from _session,
+                skipping the *IDN? query
+
         Returns:
             Union[SDG1000, SDG2000X]: Appropriate instrument instance
             
@@ -113,84 +207,76 @@ class SiglentInstrumentFactory:
         """
         if model_hint:
             # Use provided hint without detection
-            if model_hint == 'SDG1000':
-                return SDG1000(address)
-            elif model_hint == 'SDG2000X':
-                return SDG2000X(address)
-            elif model_hint == 'SDG6000X':
+            if model_hint in cls._SUPPORTED:
+                return cls._instrument_class(model_hint)(address)
+            elif model_hint == FAM_SDG6000X:
                 raise UnsupportedModelError("SDG6000X not yet implemented")
             else:
                 raise UnsupportedModelError(f"Unknown model hint: {model_hint}")
         
-        # Auto-detect model by connecting and querying *IDN?
-        # We'll use a temporary SDG2000X instance for the detection query
-        # since the base VisaInstruments class handles *IDN? uniformly
-        temp_instrument = None
+        # Auto-detect model by opening the session once, querying *IDN?, and
+        # specializing the instance in place — avoids the second VISA open
+        # (and its USB/Ethernet handshake) that a close-and-reopen would cost
+        if _session is not None:
+            # Reuse a session (and optionally its IDN) from _query_idn
+            instrument = _session
+        else:
+            # Open the session with the base class for detection
+            from visa_instruments import VisaInstruments
+            instrument = VisaInstruments(address)
+
         try:
-            # Create temporary instance for detection
-            temp_instrument = SDG2000X(address)
-            idn_response = temp_instrument.instr.query('*IDN?')
-            
+            if _session is not None and _prefetched_idn is not None:
+                idn_response = _prefetched_idn
+            else:
+                idn_response = instrument.instr.query('*IDN?')
+
             # Detect model family
             model_family = cls.detect_model_from_idn(idn_response)
-            
-            # Close temporary connection
-            temp_instrument.instr.close()
-            temp_instrument = None
-            
-            # Create appropriate instrument instance
-            if model_family == 'SDG1000':
-                return SDG1000(address)
-            elif model_family == 'SDG2000X':
-                return SDG2000X(address)
-            elif model_family == 'SDG6000X':
-                raise UnsupportedModelError("SDG6000X not yet implemented")
-            else:
-                raise UnsupportedModelError(f"Detected model family '{model_family}' not implemented")
-                
-        except Exception as e:
-            # Clean up temporary connection if it exists
-            if temp_instrument and hasattr(temp_instrument, 'instr'):
+
+            # Re-bind the instance to the detected class, reusing the session
+            if model_family in cls._SUPPORTED:
+                instrument.__class__ = cls._instrument_class(model_family)
+                # Initialize the state the subclass __init__ would have
+                instrument._post_rebind()
+                # Seed the IDN cache so a later get_info() is zero-I/O
                 try:
-                    temp_instrument.instr.close()
-                except:
+                    instrument._idn_cache = instrument._parse_idn(idn_response)
+                except ValueError:
                     pass
-            
-            # Re-raise the exception
-            if isinstance(e, UnsupportedModelError):
-                raise
+                return instrument
             else:
-                raise UnsupportedModelError(f"Failed to detect model: {str(e)}")
+                raise UnsupportedModelError(f"{model_family} not yet implemented")
+
+        except UnsupportedModelError:
+            _close_session(instrument)
+            raise
+        except Exception as e:
+            _close_session(instrument)
+            raise UnsupportedModelError(f"Failed to detect model at {address}") from e
     
     @classmethod
-    def get_supported_models(cls) -> list:
+    def get_supported_models(cls) -> tuple:
         """
-        Get list of supported model families
-        
+        Get supported model families
+
         Returns:
-            list: List of supported model families
+            tuple: Supported model families
         """
-        return ['SDG1000', 'SDG2000X']
-    
+        return cls._SUPPORTED
+
     @classmethod
-    def get_model_patterns(cls, model_family: str) -> list:
+    def get_model_patterns(cls, model_family: str) -> tuple:
         """
         Get regex patterns for a specific model family
-        
+
         Args:
             model_family: Model family name
-            
+
         Returns:
-            list: List of regex patterns for the model family
+            tuple: Regex patterns for the model family
         """
-        if model_family == 'SDG1000':
-            return cls.SDG1000_PATTERNS
-        elif model_family == 'SDG2000X':
-            return cls.SDG2000X_PATTERNS
-        elif model_family == 'SDG6000X':
-            return cls.SDG6000X_PATTERNS
-        else:
-            return []
+        return cls._PATTERN_MAP.get(model_family, ())
     
     @classmethod
     def validate_model_name(cls, model_name: str) -> tuple:
@@ -203,23 +289,106 @@ class SiglentInstrumentFactory:
         Returns:
             tuple: (is_supported, model_family, matched_pattern)
         """
-        all_patterns = [
-            ('SDG1000', cls.SDG1000_PATTERNS),
-            ('SDG2000X', cls.SDG2000X_PATTERNS),
-            ('SDG6000X', cls.SDG6000X_PATTERNS)
-        ]
-        
-        for family, patterns in all_patterns:
-            for pattern in patterns:
-                if re.search(pattern, model_name, re.IGNORECASE):
-                    return (True, family, pattern)
-        
+        return _validate_model_name(model_name)
+
+
+# Memoized pure helpers: IDN/model strings repeat across reconnects and UI
+# refreshes, so subsequent classifications collapse into a dict lookup
+
+@functools.lru_cache(maxsize=128)
+def _detect_model_from_idn(idn_response: str) -> str:
+    """Classify an *IDN? response into a model family (cached)"""
+    if not idn_response:
+        raise UnsupportedModelError("Empty or invalid *IDN? response")
+
+    # Extract the model field by slicing between the first two commas rather
+    # than splitting the whole response into a throwaway list
+    # Expected format: "Manufacturer,Model,SerialNumber,FirmwareVersion"
+    i = idn_response.find(',')
+    if i < 0:
+        raise UnsupportedModelError(f"Invalid *IDN? format: {idn_response}")
+    j = idn_response.find(',', i + 1)
+    if j < 0:
+        j = len(idn_response)
+
+    model_name = idn_response[i + 1:j].strip().upper()
+
+    # One dict lookup on the four-character prefix picks the candidate
+    # family (or rejects outright) without touching the regex engine
+    candidate = _PREFIX_TO_FAMILY.get(model_name[:4])
+    if candidate is None:
+        raise UnsupportedModelError(f"Unsupported model detected: {model_name}")
+
+    # Fast path: plain string checks cover typical model tokens
+    family = SiglentInstrumentFactory._classify(model_name)
+    if family:
+        return family
+
+    # Fall back to the candidate family's compiled patterns — at most two
+    # matches. The patterns describe the whole model token, so fullmatch
+    # lets the engine bail out early instead of retrying at every position
+    for pattern in SiglentInstrumentFactory._FAMILY_RE[candidate]:
+        if pattern.fullmatch(model_name):
+            return candidate
+
+    # Model not recognized
+    raise UnsupportedModelError(f"Unsupported model detected: {model_name}")
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_model_name(model_name: str) -> tuple:
+    """Validate and classify a model name (cached)"""
+    cls = SiglentInstrumentFactory
+    model_name = model_name.strip().upper()
+
+    # One combined match decides supported-or-not and which family matched;
+    # the patterns describe the whole model token, so use fullmatch
+    match = cls._COMBINED_RE.fullmatch(model_name)
+    if not match:
         return (False, None, None)
 
+    # Recover the specific pattern by scanning only the matched family
+    family = match.lastgroup
+    for pattern, compiled_pattern in zip(cls._PATTERN_MAP[family], cls._FAMILY_RE[family]):
+        if compiled_pattern.fullmatch(model_name):
+            return (True, family, pattern)
+
+    return (True, family, None)
+
+
+def _close_session(session) -> None:
+    """Close a session's VISA resource, ignoring close-time errors"""
+    try:
+        session.instr.close()
+    except Exception:
+        pass
+
+
+def _query_idn(address: str) -> tuple:
+    """
+    Open a VISA session and query *IDN? once
+
+    Shared by detect_siglent_model and create_siglent_instrument so a
+    "detect then create" sequence pays a single session open.
+
+    Args:
+        address: VISA resource address
+
+    Returns:
+        tuple: (open VisaInstruments session, IDN response string)
+    """
+    from visa_instruments import VisaInstruments
+    session = VisaInstruments(address)
+    try:
+        return (session, session.instr.query('*IDN?'))
+    except Exception:
+        _close_session(session)
+        raise
+
 
 # Convenience functions for backward compatibility and ease of use
 
-def create_siglent_instrument(address: str, model_hint: Optional[str] = None) -> Union[SDG1000, SDG2000X]:
+def create_siglent_instrument(address: str, model_hint: Optional[str] = None) -> Union['SDG1000', 'SDG2000X']:
     """
     Convenience function to create a Siglent instrument instance
     
@@ -230,57 +399,91 @@ def create_siglent_instrument(address: str, model_hint: Optional[str] = None) ->
     Returns:
         Union[SDG1000, SDG2000X]: Appropriate instrument instance
     """
-    return SiglentInstrumentFactory.create_instrument(address, model_hint)
+    if model_hint:
+        return SiglentInstrumentFactory.create_instrument(address, model_hint)
+
+    session, idn_response = _query_idn(address)
+    return SiglentInstrumentFactory.create_instrument(
+        address, _session=session, _prefetched_idn=idn_response)
 
 
 def detect_siglent_model(address: str) -> str:
     """
     Convenience function to detect Siglent model without creating persistent connection
-    
+
     Args:
         address: VISA resource address
-        
+
     Returns:
         str: Detected model family
     """
-    temp_instrument = None
+    session, idn_response = _query_idn(address)
     try:
-        temp_instrument = SDG2000X(address)
-        idn_response = temp_instrument.instr.query('*IDN?')
         return SiglentInstrumentFactory.detect_model_from_idn(idn_response)
     finally:
-        if temp_instrument and hasattr(temp_instrument, 'instr'):
-            try:
-                temp_instrument.instr.close()
-            except:
-                pass
+        _close_session(session)
 
 
-# Example usage and testing
-if __name__ == "__main__":
-    # Test model detection patterns
+# Example usage and micro-benchmark
+def _selftest(n: int = 100000) -> None:
+    """
+    Exercise and time the classification hot path
+
+    Runs the fixed corpus once for a correctness printout, then n times to
+    measure steady-state classification cost with the compiled patterns and
+    caches warm — a quick regression check for the detection path.
+
+    Args:
+        n: Number of timed classification rounds over the corpus
+    """
+    import time
+
     test_idn_responses = [
         "Siglent Technologies,SDG1025,SDG1XXXXXXXX,1.01.01.33R5",
         "Siglent Technologies,SDG2042X,SDG2XXXXXXXX,2.01.01.35R2",
         "Siglent Technologies,SDG6032X,SDG6XXXXXXXX,3.01.01.10R1",
         "Unknown Manufacturer,MODEL123,SERIAL,1.0.0"
     ]
-    
+    test_models = ["SDG1025", "SDG2042X", "SDG6032X", "UNKNOWN123"]
+
     factory = SiglentInstrumentFactory()
-    
+
     for idn in test_idn_responses:
         try:
             model = factory.detect_model_from_idn(idn)
             print(f"✓ {idn} -> {model}")
         except UnsupportedModelError as e:
             print(f"✗ {idn} -> {e}")
-    
-    # Test model name validation
-    test_models = ["SDG1025", "SDG2042X", "SDG6032X", "UNKNOWN123"]
-    
+
     for model in test_models:
         supported, family, pattern = factory.validate_model_name(model)
         if supported:
             print(f"✓ {model} -> {family} (pattern: {pattern})")
         else:
             print(f"✗ {model} -> Not supported")
+
+    # Timed loops over the warm classifiers
+    start = time.perf_counter()
+    for _ in range(n):
+        for idn in test_idn_responses:
+            try:
+                factory.detect_model_from_idn(idn)
+            except UnsupportedModelError:
+                pass
+    detect_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n):
+        for model in test_models:
+            factory.validate_model_name(model)
+    validate_time = time.perf_counter() - start
+
+    calls = n * len(test_idn_responses)
+    print(f"detect_model_from_idn: {calls} calls in {detect_time:.3f}s "
+          f"({detect_time / calls * 1e6:.2f} µs/call)")
+    print(f"validate_model_name:   {calls} calls in {validate_time:.3f}s "
+          f"({validate_time / calls * 1e6:.2f} µs/call)")
+
+
+if __name__ == "__main__":
+    _selftest()
@@ -15,9 +15,94 @@ Key differences from SDG2000X:
 @reference: SDG1000 Data Sheet DS02010-E08A, Siglent API Reference
 """
 
+import re
+import time
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
 from typing import Union, Optional
 from visa_instruments import VisaInstruments
 
+# Splits on commas and swallows surrounding whitespace in one C-level
+# pass, replacing strip-per-field loops
+_SPLIT = re.compile(r'\s*,\s*')
+
+# Deletes every character of the unit suffixes (HZ, S, V, Vrms, dBm) in a
+# single C-level pass instead of one str.replace scan per unit. Safe because
+# numeric SCPI values only contain digits, sign, dot and 'e'
+_UNIT_TT = str.maketrans('', '', 'HZVrmsdBS')
+
+
+# Value parsers used by the dispatch tables below
+def _plain(value: str) -> str:
+    return value
+
+def _unit_float(value: str) -> float:
+    return float(value.translate(_UNIT_TT))
+
+def _load_value(value: str):
+    if value == 'HZ':
+        return SDG1000.HIGH_IMPEDANCE
+    return float(value)
+
+
+# O(1) dispatch tables replacing the per-field if-chains in the response
+# parsers: SCPI token -> (result key, value parser)
+_BSWV_PARSE = {
+    'C1:BSWV WVTP': ('type', _plain),
+    'C2:BSWV WVTP': ('type', _plain),
+    'FRQ': ('frequency', _unit_float),
+    'PERI': ('period', _unit_float),
+    'AMP': ('amplitude', _unit_float),
+    'AMPVRMS': ('amp_vrms', _unit_float),
+    'AMPDBM': ('amp_dbm', _unit_float),
+    'MAX_OUTPUT_AMP': ('max_output_amp', _unit_float),
+    'OFST': ('offset', _unit_float),
+    'HLEV': ('high_level', _unit_float),
+    'LLEV': ('low_level', _unit_float),
+    'PHSE': ('phase', float),
+    'DUTY': ('duty', float),
+    'SYM': ('symmetry', float),
+    'WIDTH': ('width', float),
+    'RISE': ('rise', _unit_float),
+    'FALL': ('fall', _unit_float),
+    'DLY': ('delay', float),
+    'STDEV': ('stdev', _unit_float),
+    'MEAN': ('mean', _unit_float)
+}
+
+_OUTP_PARSE = {
+    'LOAD': ('load', _load_value),
+    'POWERON_STATE': ('poweron_state', float),
+    'PLRT': ('polarity', _plain)
+}
+
+# Matches the 'Cn:OUTP state' header; a non-matching reply just leaves
+# 'state' out instead of tripping over a malformed split
+_OUTP_HEAD_RE = re.compile(r'C[12]:OUTP\s+(\w+)')
+
+_ARWV_PARSE = {
+    'INDEX': ('index', int),
+    'NAME': ('name', _plain)
+}
+
+# Channel command prefixes, prebuilt once so the setters concatenate a
+# constant instead of rebuilding 'Cn:BSWV ' / 'Cn:OUTP ' per call
+_OUTP_PREFIX = {c: f'{c}:OUTP ' for c in ('C1', 'C2')}
+
+# Fully fused per-(channel, parameter) command templates: the setters
+# only append the value, so the hot path does one concatenation instead
+# of re-joining prefix and token on every call
+_BSWV_TOKENS = ('WVTP', 'FRQ', 'PERI', 'AMP', 'OFST', 'SYM', 'DUTY', 'PHSE',
+                'STDEV', 'MEAN', 'WIDTH', 'RISE', 'FALL', 'DLY', 'HLEV',
+                'LLEV')
+_BSWV_TEMPL = {(c, token): f'{c}:BSWV {token},'
+               for c in ('C1', 'C2') for token in _BSWV_TOKENS}
+_OUTP_TEMPL = {(c, token): f'{c}:OUTP {token},'
+               for c in ('C1', 'C2') for token in ('LOAD', 'PLRT')}
+
 
 class SDG1000(VisaInstruments):   
     """
@@ -27,6 +112,10 @@ class SDG1000(VisaInstruments):
     with parameter validation and model-specific constraints.
     """
 
+    # Same layout as VisaInstruments so the factory can specialize a
+    # detection session in place with a __class__ assignment
+    __slots__ = ()
+
     # Channel definitions (same as SDG2000X)
     CHANNEL1 = 'C1'
     CHANNEL2 = 'C2'
@@ -66,6 +155,25 @@ class SDG1000(VisaInstruments):
     FREQ_MAX_PULSE = 5e6     # 5 MHz for pulse
     FREQ_MAX_NOISE = 5e6     # 5 MHz for noise
     FREQ_MAX_ARB = 5e6       # 5 MHz for arbitrary waveforms
+
+    # Per-waveform frequency ceilings; types not listed use FREQ_MAX
+    WAVEFORM_FREQ_MAX = {
+        WAVEFORM_RAMP: FREQ_MAX_RAMP,
+        WAVEFORM_PULSE: FREQ_MAX_PULSE,
+        WAVEFORM_NOISE: FREQ_MAX_NOISE,
+        WAVEFORM_ARB: FREQ_MAX_ARB,
+    }
+
+    # Amplitude ceiling per load; unknown loads fall back to the more
+    # restrictive 50 ohm limit
+    LOAD_MAX_AMP = {
+        LOAD_50_OHM: AMP_MAX_50_OHM,
+        HIGH_IMPEDANCE: AMP_MAX_HIGH_Z,
+    }
+
+    # Canonical accepted loads; the 'HZ' spelling normalizes to
+    # HIGH_IMPEDANCE before the membership test
+    _VALID_LOADS = frozenset({LOAD_50_OHM, HIGH_IMPEDANCE})
     
     # Burst mode limits (SDG1000 specific)
     BURST_CYCLES_MIN = 1
@@ -75,10 +183,89 @@ class SDG1000(VisaInstruments):
     ARB_POINTS_MAX = 4096     # 4k points vs 16k for SDG2000X
     ARB_RESOLUTION = 12       # 12-bit vs 14-bit for SDG2000X
 
+    # How long a cached channel snapshot keeps serving reads (see _snapshot)
+    SNAPSHOT_TTL = 0.1        # seconds
+
     def __init__(self, address: str):
         """Initialize SDG1000 instrument"""
         super().__init__(address)
+        self._post_rebind()
+
+    def _post_rebind(self):
+        """Sets up the SDG1000 per-instance state (also run when the
+        factory re-binds a detection session to this class)"""
         self.model_name = "SDG1000"
+        # Per-channel (channel, kind) -> (deadline, dict) snapshot cache;
+        # see _snapshot
+        self._state = {}
+
+    def _write(self, command: str):
+        """Send a command now, or buffer it while a batch() is open"""
+        # Any Cn:BSWV / Cn:OUTP write makes that part of the channel
+        # snapshot stale
+        kind = command[3:7]
+        if kind == 'BSWV' or kind == 'OUTP':
+            self._state.pop((command[:2], kind), None)
+        if self._pending is None:
+            self.instr.write(command)
+        else:
+            self._pending.append(command)
+
+    def _query(self, query: str):
+        """Flush any buffered writes, then query, so ordering holds"""
+        if self._pending:
+            self.flush()
+        return self.instr.query(query)
+
+    def _snapshot(self, channel: str):
+        """
+        Refreshes the cached state of one channel
+
+        A single compound Cn:BSWV?;Cn:OUTP? query fetches everything the
+        getters and validators need, so a read-modify-write cycle pays one
+        round trip instead of one per field. Entries stay valid for
+        SNAPSHOT_TTL seconds; setters drop the entry they touch.
+        """
+        response = self._query(f'{channel}:BSWV?;{channel}:OUTP?')
+        bswv, _, outp = response.partition(';')
+        deadline = time.monotonic() + self.SNAPSHOT_TTL
+        wave = self._parse_bswv(bswv)
+        output = self._parse_outp(outp)
+        self._state[(channel, 'BSWV')] = (deadline, wave)
+        self._state[(channel, 'OUTP')] = (deadline, output)
+        return wave, output
+
+    def reset(self):
+        """Resets the instrument and drops the cached channel snapshots"""
+        self._state.clear()
+        super().reset()
+
+    def _cached_state(self, channel: str, kind: str):
+        """Returns the cached dict for (channel, kind), or None if stale"""
+        entry = self._state.get((channel, kind))
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    def _apply(self, channel: str, kind: str, field: str, value,
+               command: str, force: bool = False):
+        """
+        Sends the command unless the fresh channel snapshot already holds
+        `value` for `field`, so re-applying an unchanged setting (a UI
+        slider re-sending the same amplitude, say) costs no bus traffic.
+        Pass force=True to re-assert regardless. After a send the new
+        value is folded back into the snapshot, keeping the next repeat
+        free as well.
+        """
+        if not force:
+            cached = self._cached_state(channel, kind)
+            if cached is not None and cached.get(field) == value:
+                return
+        entry = self._state.get((channel, kind))
+        self._write(command)
+        if entry is not None and time.monotonic() < entry[0]:
+            entry[1][field] = value
+            self._state[(channel, kind)] = entry
         
     def _validate_frequency(self, frequency: float, waveform_type: Optional[str] = None) -> bool:
         """
@@ -98,19 +285,11 @@ class SDG1000(VisaInstruments):
             raise ValueError(f"Frequency {frequency} Hz out of range "
                            f"({self.FREQ_MIN} Hz - {self.FREQ_MAX} Hz) for SDG1000")
         
-        # Check waveform-specific limits
-        if waveform_type == self.WAVEFORM_RAMP and frequency > self.FREQ_MAX_RAMP:
-            raise ValueError(f"Frequency {frequency} Hz exceeds RAMP limit "
-                           f"({self.FREQ_MAX_RAMP} Hz) for SDG1000")
-        elif waveform_type == self.WAVEFORM_PULSE and frequency > self.FREQ_MAX_PULSE:
-            raise ValueError(f"Frequency {frequency} Hz exceeds PULSE limit "
-                           f"({self.FREQ_MAX_PULSE} Hz) for SDG1000")
-        elif waveform_type == self.WAVEFORM_NOISE and frequency > self.FREQ_MAX_NOISE:
-            raise ValueError(f"Frequency {frequency} Hz exceeds NOISE limit "
-                           f"({self.FREQ_MAX_NOISE} Hz) for SDG1000")
-        elif waveform_type == self.WAVEFORM_ARB and frequency > self.FREQ_MAX_ARB:
-            raise ValueError(f"Frequency {frequency} Hz exceeds ARB limit "
-                           f"({self.FREQ_MAX_ARB} Hz) for SDG1000")
+        # Check waveform-specific limits with a single dict lookup
+        limit = self.WAVEFORM_FREQ_MAX.get(waveform_type, self.FREQ_MAX)
+        if frequency > limit:
+            raise ValueError(f"Frequency {frequency} Hz exceeds {waveform_type} limit "
+                           f"({limit} Hz) for SDG1000")
         
         return True
     
@@ -132,29 +311,20 @@ class SDG1000(VisaInstruments):
             raise ValueError(f"Amplitude {amplitude} V below minimum "
                            f"({self.AMP_MIN} V) for SDG1000")
         
-        # Check load-dependent limits
-        if load_impedance == self.LOAD_50_OHM:
-            if amplitude > self.AMP_MAX_50_OHM:
-                raise ValueError(f"Amplitude {amplitude} V exceeds 50Ω limit "
-                               f"({self.AMP_MAX_50_OHM} V) for SDG1000")
-        elif load_impedance == self.HIGH_IMPEDANCE:
-            if amplitude > self.AMP_MAX_HIGH_Z:
-                raise ValueError(f"Amplitude {amplitude} V exceeds High-Z limit "
-                               f"({self.AMP_MAX_HIGH_Z} V) for SDG1000")
-        else:
-            # Default to more restrictive 50Ω limit if unknown
-            if amplitude > self.AMP_MAX_50_OHM:
-                raise ValueError(f"Amplitude {amplitude} V exceeds default limit "
-                               f"({self.AMP_MAX_50_OHM} V) for SDG1000")
+        # Check load-dependent limits with a single dict lookup
+        limit = self.LOAD_MAX_AMP.get(load_impedance, self.AMP_MAX_50_OHM)
+        if amplitude > limit:
+            raise ValueError(f"Amplitude {amplitude} V exceeds load limit "
+                           f"({limit} V) for SDG1000")
         
         return True
     
-    def _validate_load_impedance(self, load: int) -> bool:
+    def _validate_load_impedance(self, load: Union[str, int]) -> bool:
         """
         Validate load impedance against SDG1000 specifications
         
         Args:
-            load: Load impedance value
+            load: Load impedance value (50, HIGH_IMPEDANCE or 'HZ')
             
         Returns:
             bool: True if load is valid
@@ -162,7 +332,9 @@ class SDG1000(VisaInstruments):
         Raises:
             ValueError: If load impedance is not supported
         """
-        if load not in [self.LOAD_50_OHM, self.HIGH_IMPEDANCE]:
+        if load == 'HZ':
+            load = self.HIGH_IMPEDANCE
+        if load not in self._VALID_LOADS:
             raise ValueError(f"Load impedance {load} not supported by SDG1000. "
                            f"Supported values: {self.LOAD_50_OHM}Ω, High-Z")
         return True
@@ -173,36 +345,33 @@ class SDG1000(VisaInstruments):
         """
         Returns the output state, load and polarity parameters 
         value of the set channel (same as SDG2000X implementation)
+
+        Served from the channel snapshot; see _snapshot
         
         Args:
             channel: the set channel
         """
-        query = f'{channel}:OUTP?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')       
+        cached = self._cached_state(channel, 'OUTP')
+        if cached is not None:
+            return cached
+        return self._snapshot(channel)[1]
+
+    @staticmethod
+    def _parse_outp(response: str):
+        """Parses a Cn:OUTP reply into the get_output_state dictionary"""
+        fields = _SPLIT.split(response.strip())
         
         # creates a dictionary
         instrument_dict = {}
-        first = fields[0].strip().split(' ')
-        if len(first) == 2:
-            key, value = first
-        if key in ('C1:OUTP', 'C2:OUTP'):
-            instrument_dict['state'] = value
+        head = _OUTP_HEAD_RE.match(fields[0])
+        if head:
+            instrument_dict['state'] = head.group(1)
 
-        rest = fields[1:]       
+        rest = fields[1:]
         for i in range(0, len(rest) - 1, 2):
-            key = rest[i].strip()
-            value = rest[i + 1].strip()
-
-            if key == 'LOAD':
-                if value == 'HZ':
-                    instrument_dict['load'] = SDG1000.HIGH_IMPEDANCE
-                else:
-                    instrument_dict['load'] = float(value)
-            if key == 'POWERON_STATE':
-                instrument_dict['poweron_state'] = float(value)
-            if key == 'PLRT':
-                instrument_dict['polarity'] = value
+            name, parser = _OUTP_PARSE.get(rest[i], (None, None))
+            if name:
+                instrument_dict[name] = parser(rest[i + 1])
 
         return instrument_dict
     
@@ -210,57 +379,27 @@ class SDG1000(VisaInstruments):
         """
         Returns wave information of the set channel (same as SDG2000X implementation)
 
+        Served from the channel snapshot; see _snapshot
+
         Args:
             channel: the set channel
         """
-        query = f'{channel}:BSWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
+        cached = self._cached_state(channel, 'BSWV')
+        if cached is not None:
+            return cached
+        return self._snapshot(channel)[0]
+
+    @staticmethod
+    def _parse_bswv(response: str):
+        """Parses a Cn:BSWV reply into the get_wave_info dictionary"""
+        fields = _SPLIT.split(response.strip())
 
         # creates a dictionary
         instrument_dict = {}
         for i in range(0, len(fields), 2):
-            key = fields[i].strip()
-            value = fields[i + 1].strip()
-
-            if key in ('C1:BSWV WVTP', 'C2:BSWV WVTP'):
-                instrument_dict['type'] = value
-            if key == 'FRQ':
-                instrument_dict['frequency'] = float(value.replace('HZ', ''))
-            if key == 'PERI':
-                instrument_dict['period'] = float(value.replace('S', ''))
-            if key == 'AMP':
-                instrument_dict['amplitude'] = float(value.replace('V', ''))
-            if key == 'AMPVRMS':
-                instrument_dict['amp_vrms'] = float(value.replace('Vrms', ''))
-            if key == 'AMPDBM':
-                instrument_dict['amp_dbm'] = float(value.replace('dBm', ''))
-            if key == 'MAX_OUTPUT_AMP':
-                instrument_dict['max_output_amp'] = float(value.replace('V', ''))
-            if key == 'OFST':
-                instrument_dict['offset'] = float(value.replace('V', ''))
-            if key == 'HLEV':
-                instrument_dict['high_level'] = float(value.replace('V', ''))
-            if key == 'LLEV':
-                instrument_dict['low_level'] = float(value.replace('V', ''))
-            if key == 'PHSE':
-                instrument_dict['phase'] = float(value)
-            if key == 'DUTY':
-                instrument_dict['duty'] = float(value)
-            if key == 'SYM':
-                instrument_dict['symmetry'] = float(value)
-            if key == 'WIDTH':
-                instrument_dict['width'] = float(value)
-            if key == 'RISE':
-                instrument_dict['rise'] = float(value.replace('S', ''))
-            if key == 'FALL':
-                instrument_dict['fall'] = float(value.replace('S', ''))
-            if key == 'DLY':
-                instrument_dict['delay'] = float(value)
-            if key == 'STDEV':
-                instrument_dict['stdev'] = float(value.replace('V', ''))
-            if key == 'MEAN':
-                instrument_dict['mean'] = float(value.replace('V', ''))
+            name, parser = _BSWV_PARSE.get(fields[i], (None, None))
+            if name:
+                instrument_dict[name] = parser(fields[i + 1])
 
         return instrument_dict
     
@@ -269,19 +408,14 @@ class SDG1000(VisaInstruments):
         Used to read the stored wave data names (same as SDG2000X implementation)
         """
         query = 'STL?'
-        response = self.instr.query(query)
-        fields = response.replace('STL','').split(',')
-        
-        # creates a dictionary
-        instrument_dict = {}
-        counts = 0
-        
-        for i in range(0, len(fields) - 1, 2):
-            counts += 1
-            key = fields[i].strip()
-            value = fields[i + 1].strip()
-            instrument_dict[int(key.replace('M', ''))] = value
-
+        response = self._query(query)
+
+        # header is 'STL '; slice it off, then pair the index/name fields
+        # by slicing instead of an index-stepped loop
+        _, _, payload = response.partition(' ')
+        fields = [f.strip() for f in payload.split(',')]
+        instrument_dict = {int(k.lstrip('M')): v
+                           for k, v in zip(fields[::2], fields[1::2])}
         return dict(sorted(instrument_dict.items()))
     
     def get_arb_wave_type(self, channel):
@@ -292,29 +426,82 @@ class SDG1000(VisaInstruments):
             channel: the set channel (C1, C2)
         """
         query = f'{channel}:ARWV?'
-        response = self.instr.query(query)
+        response = self._query(query)
 
-        if channel == SDG1000.CHANNEL1:
-            fields = response.replace('C1:ARWV','').split(',')
-        elif channel == SDG1000.CHANNEL2:
-            fields = response.replace('C2:ARWV','').split(',')
+        # header is 'Cn:ARWV '; everything after the first space is payload,
+        # so no per-channel branch or replace scan is needed
+        _, _, payload = response.partition(' ')
+        fields = _SPLIT.split(payload.strip())
 
         # creates a dictionary
         instrument_dict = {}
         for i in range(0, len(fields) - 1, 2):
-            key = fields[i].strip()
-            value = fields[i + 1].strip()
-
-            if key == 'INDEX':
-                instrument_dict['index'] = int(value)
-            if key == 'NAME':
-                instrument_dict['name'] = value
+            name, parser = _ARWV_PARSE.get(fields[i], (None, None))
+            if name:
+                instrument_dict[name] = parser(fields[i + 1])
 
         return instrument_dict
 
     # Setter methods with SDG1000-specific validation
+
+    def configure_wave(self, channel: str, *, waveform: Optional[str] = None,
+                       frequency: Optional[float] = None,
+                       amplitude: Optional[float] = None,
+                       offset: Optional[float] = None,
+                       phase: Optional[float] = None):
+        """
+        Sets several basic wave parameters with one compound BSWV write
+
+        Runs the same SDG1000 validation as the individual setters, then
+        fuses every provided pair into a single command such as
+        'C1:BSWV WVTP,SINE,FRQ,1000,AMP,2.0' — one bus transfer instead
+        of one per field. Validation that needs instrument state (the
+        waveform type for frequency limits, the load for amplitude and
+        offset limits) uses the provided value or the cached snapshot and
+        never issues an extra query.
+
+        Args:
+            channel: the set channel (C1, C2)
+            waveform: type of waveform (SINE, SQUARE, RAMP, PULSE, NOISE, ARB)
+            frequency: wave frequency (Hz)
+            amplitude: wave amplitude (V)
+            offset: wave offset (V)
+            phase: wave phase (degrees)
+        """
+        cached = self._cached_state(channel, 'BSWV') or {}
+        cached_output = self._cached_state(channel, 'OUTP') or {}
+        load_impedance = cached_output.get('load', self.LOAD_50_OHM)
+
+        pairs = []
+        if waveform is not None:
+            if waveform not in (self.WAVEFORM_SINE, self.WAVEFORM_SQUARE,
+                                self.WAVEFORM_RAMP, self.WAVEFORM_PULSE,
+                                self.WAVEFORM_NOISE, self.WAVEFORM_ARB):
+                raise ValueError(f"Waveform type '{waveform}' not supported "
+                               f"by SDG1000")
+            pairs.append(f'WVTP,{waveform}')
+        if frequency is not None:
+            waveform_type = waveform if waveform is not None else cached.get('type')
+            self._validate_frequency(frequency, waveform_type)
+            pairs.append(f'FRQ,{frequency}')
+        if amplitude is not None:
+            self._validate_amplitude(amplitude, load_impedance)
+            pairs.append(f'AMP,{amplitude}')
+        if offset is not None:
+            max_offset = (self.OFFSET_MAX_50_OHM
+                          if load_impedance == self.LOAD_50_OHM
+                          else self.OFFSET_MAX_HIGH_Z)
+            if abs(offset) > max_offset:
+                raise ValueError(f"Offset {offset} V exceeds limit "
+                               f"(±{max_offset} V) for SDG1000")
+            pairs.append(f'OFST,{offset}')
+        if phase is not None:
+            pairs.append(f'PHSE,{phase}')
+
+        if pairs:
+            self._write(f'{channel}:BSWV ' + ','.join(pairs))
     
-    def set_waveform(self, channel: str, waveform_type: str):
+    def set_waveform(self, channel: str, waveform_type: str, force: bool = False):
         """
         Can set waveform of set channel (with SDG1000 validation)
         
@@ -334,10 +521,10 @@ class SDG1000(VisaInstruments):
             raise ValueError(f"Waveform type '{waveform_type}' not supported by SDG1000. "
                            f"Supported types: {supported_waveforms}")
         
-        write = f'{channel}:BSWV WVTP,{waveform_type}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'WVTP'] + f'{waveform_type}'
+        self._apply(channel, 'BSWV', 'type', waveform_type, write, force)
 
-    def set_wave_frequency(self, channel: str, frequency: float):
+    def set_wave_frequency(self, channel: str, frequency: float, force: bool = False):
         """
         Can set frequency of set channel (with SDG1000 validation)
 
@@ -357,10 +544,10 @@ class SDG1000(VisaInstruments):
             
         self._validate_frequency(frequency, waveform_type)
         
-        write = f'{channel}:BSWV FRQ,{frequency}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'FRQ'] + f'{frequency}'
+        self._apply(channel, 'BSWV', 'frequency', frequency, write, force)
 
-    def set_wave_period(self, channel: str, period: float):
+    def set_wave_period(self, channel: str, period: float, force: bool = False):
         """
         Can set period of set channel (with SDG1000 validation)
 
@@ -379,10 +566,10 @@ class SDG1000(VisaInstruments):
             
         self._validate_frequency(frequency, waveform_type)
         
-        write = f'{channel}:BSWV PERI,{period}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'PERI'] + f'{period}'
+        self._apply(channel, 'BSWV', 'period', period, write, force)
 
-    def set_wave_amplitude(self, channel: str, amplitude: float):
+    def set_wave_amplitude(self, channel: str, amplitude: float, force: bool = False):
         """
         Can set amplitude of set channel (with SDG1000 validation)
 
@@ -399,10 +586,10 @@ class SDG1000(VisaInstruments):
             
         self._validate_amplitude(amplitude, load_impedance)
         
-        write = f'{channel}:BSWV AMP,{amplitude}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'AMP'] + f'{amplitude}'
+        self._apply(channel, 'BSWV', 'amplitude', amplitude, write, force)
 
-    def set_wave_offset(self, channel: str, offset: float):
+    def set_wave_offset(self, channel: str, offset: float, force: bool = False):
         """
         Can set offset of set channel (with SDG1000 validation)
 
@@ -423,10 +610,10 @@ class SDG1000(VisaInstruments):
             raise ValueError(f"Offset {offset} V exceeds limit "
                            f"(±{max_offset} V) for SDG1000")
         
-        write = f'{channel}:BSWV OFST,{offset}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'OFST'] + f'{offset}'
+        self._apply(channel, 'BSWV', 'offset', offset, write, force)
 
-    def set_output_load(self, channel: str, load: Union[str, int]):
+    def set_output_load(self, channel: str, load: Union[str, int], force: bool = False):
         """
         Can set load output of set channel (with SDG1000 validation)
 
@@ -442,83 +629,83 @@ class SDG1000(VisaInstruments):
         self._validate_load_impedance(load_value)
         
         if load_value == self.HIGH_IMPEDANCE:
-            write = f'{channel}:OUTP LOAD,HZ'
+            write = _OUTP_TEMPL[channel, 'LOAD'] + 'HZ'
         else:
-            write = f'{channel}:OUTP LOAD,{load_value}'
+            write = _OUTP_TEMPL[channel, 'LOAD'] + f'{load_value}'
         
-        self.instr.write(write)
+        self._apply(channel, 'OUTP', 'load', load_value, write, force)
 
     # The following methods are identical to SDG2000X and don't need SDG1000-specific validation
     
-    def set_wave_symmetry(self, channel: str, symmetry: float):
+    def set_wave_symmetry(self, channel: str, symmetry: float, force: bool = False):
         """Can set symmetry of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV SYM,{symmetry}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'SYM'] + f'{symmetry}'
+        self._apply(channel, 'BSWV', 'symmetry', symmetry, write, force)
 
-    def set_wave_duty(self, channel: str, duty):
+    def set_wave_duty(self, channel: str, duty, force: bool = False):
         """Can set duty of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV DUTY,{duty}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'DUTY'] + f'{duty}'
+        self._apply(channel, 'BSWV', 'duty', duty, write, force)
 
-    def set_wave_phase(self, channel: str, phase: float):
+    def set_wave_phase(self, channel: str, phase: float, force: bool = False):
         """Can set phase of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV PHSE,{phase}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'PHSE'] + f'{phase}'
+        self._apply(channel, 'BSWV', 'phase', phase, write, force)
 
-    def set_wave_stdev(self, channel: str, stdev: float):
+    def set_wave_stdev(self, channel: str, stdev: float, force: bool = False):
         """Can set stdev of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV STDEV,{stdev}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'STDEV'] + f'{stdev}'
+        self._apply(channel, 'BSWV', 'stdev', stdev, write, force)
 
-    def set_wave_mean(self, channel: str, mean: float):
+    def set_wave_mean(self, channel: str, mean: float, force: bool = False):
         """Can set mean of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV MEAN,{mean}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'MEAN'] + f'{mean}'
+        self._apply(channel, 'BSWV', 'mean', mean, write, force)
 
-    def set_wave_width(self, channel: str, width: float):
+    def set_wave_width(self, channel: str, width: float, force: bool = False):
         """Can set width of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV WIDTH,{width}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'WIDTH'] + f'{width}'
+        self._apply(channel, 'BSWV', 'width', width, write, force)
 
-    def set_wave_rise(self, channel: str, rise: float):
+    def set_wave_rise(self, channel: str, rise: float, force: bool = False):
         """Can set rise of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV RISE,{rise}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'RISE'] + f'{rise}'
+        self._apply(channel, 'BSWV', 'rise', rise, write, force)
 
-    def set_wave_fall(self, channel: str, fall: float):
+    def set_wave_fall(self, channel: str, fall: float, force: bool = False):
         """Can set fall of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV FALL,{fall}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'FALL'] + f'{fall}'
+        self._apply(channel, 'BSWV', 'fall', fall, write, force)
 
-    def set_wave_delay(self, channel: str, delay: float):
+    def set_wave_delay(self, channel: str, delay: float, force: bool = False):
         """Can set delay of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV DLY,{delay}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'DLY'] + f'{delay}'
+        self._apply(channel, 'BSWV', 'delay', delay, write, force)
 
-    def set_wave_high_level(self, channel: str, high_level: float):
+    def set_wave_high_level(self, channel: str, high_level: float, force: bool = False):
         """Can set high_level of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV HLEV,{high_level}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'HLEV'] + f'{high_level}'
+        self._apply(channel, 'BSWV', 'high_level', high_level, write, force)
 
-    def set_wave_low_level(self, channel: str, low_level: float):
+    def set_wave_low_level(self, channel: str, low_level: float, force: bool = False):
         """Can set low_level of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV LLEV,{low_level}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'LLEV'] + f'{low_level}'
+        self._apply(channel, 'BSWV', 'low_level', low_level, write, force)
 
-    def set_output_state(self, channel: str, state: str):
+    def set_output_state(self, channel: str, state: str, force: bool = False):
         """Can set output state of set channel (same as SDG2000X)"""
-        write = f'{channel}:OUTP {state}'
-        self.instr.write(write)
+        write = _OUTP_PREFIX[channel] + state
+        self._apply(channel, 'OUTP', 'state', state, write, force)
 
-    def set_output_polarity(self, channel: str, polarity: str):
+    def set_output_polarity(self, channel: str, polarity: str, force: bool = False):
         """Can set polarity output of set channel (same as SDG2000X)"""
-        write = f'{channel}:OUTP PLRT,{polarity}'
-        self.instr.write(write)
+        write = _OUTP_TEMPL[channel, 'PLRT'] + f'{polarity}'
+        self._apply(channel, 'OUTP', 'polarity', polarity, write, force)
 
     def set_arb_wave_type(self, channel, index: int):
         """Can sets arbitrary wave type by name or index (same as SDG2000X)"""
         write = f'{channel}:ARWV INDEX,{index}'
-        self.instr.write(write)
+        self._write(write)
 
     # Advanced feature methods (adapted for SDG1000)
     
@@ -535,10 +722,11 @@ class SDG1000(VisaInstruments):
             depth: modulation depth
         """
         # Enable/disable modulation
+        state = state.upper()
         write = f'{channel}:MDWV STATE,{state}'
-        self.instr.write(write)
+        self._write(write)
         
-        if state.upper() == 'ON' and mod_type:
+        if state == 'ON' and mod_type:
             # Set modulation type and parameters
             if mod_type:
                 write = f'{channel}:MDWV {mod_type}'
@@ -549,7 +737,7 @@ class SDG1000(VisaInstruments):
                         write += f',DEPTH,{depth}'
                     elif mod_type == 'FM':
                         write += f',DEVI,{depth}'
-                self.instr.write(write)
+                self._write(write)
 
     def get_modulation_settings(self, channel: str):
         """
@@ -559,16 +747,12 @@ class SDG1000(VisaInstruments):
             channel: the set channel (C1, C2)
         """
         query = f'{channel}:MDWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
-        
-        # Parse modulation settings
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            if i + 1 < len(fields):
-                key = fields[i].strip()
-                value = fields[i + 1].strip()
-                instrument_dict[key.lower()] = value
+        response = self._query(query)
+        fields = _SPLIT.split(response.strip())
+
+        # Parse modulation settings by pairing even/odd fields
+        instrument_dict = {key.lower(): value for key, value
+                           in zip(fields[::2], fields[1::2])}
         
         return instrument_dict
 
@@ -591,20 +775,21 @@ class SDG1000(VisaInstruments):
                                f"({self.BURST_CYCLES_MIN}-{self.BURST_CYCLES_MAX}) for SDG1000")
         
         # Enable/disable burst
+        state = state.upper()
         write = f'{channel}:BTWV STATE,{state}'
-        self.instr.write(write)
+        self._write(write)
         
-        if state.upper() == 'ON':
+        if state == 'ON':
             # Set burst parameters
             if n_cycle:
                 write = f'{channel}:BTWV GATE_NCYC,{n_cycle}'
-                self.instr.write(write)
+                self._write(write)
             if period:
                 write = f'{channel}:BTWV PRD,{period}'
-                self.instr.write(write)
+                self._write(write)
             if trigger_source:
                 write = f'{channel}:BTWV TRSR,{trigger_source}'
-                self.instr.write(write)
+                self._write(write)
 
     def get_burst_settings(self, channel: str):
         """
@@ -614,19 +799,38 @@ class SDG1000(VisaInstruments):
             channel: the set channel (C1, C2)
         """
         query = f'{channel}:BTWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
-        
-        # Parse burst settings
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            if i + 1 < len(fields):
-                key = fields[i].strip()
-                value = fields[i + 1].strip()
-                instrument_dict[key.lower()] = value
+        response = self._query(query)
+        fields = _SPLIT.split(response.strip())
+
+        # Parse burst settings by pairing even/odd fields
+        instrument_dict = {key.lower(): value for key, value
+                           in zip(fields[::2], fields[1::2])}
         
         return instrument_dict
 
+    def configure_sweep(self, channel: str, fstart: float, fstop: float,
+                        time_s: float, mode: str = 'LIN'):
+        """
+        Starts the instrument's internal frequency sweep with one write
+
+        Replaces a Python loop over set_wave_frequency: the DDS steps
+        the frequency internally, so N per-step round trips collapse
+        into a single compound SWWV command.
+
+        Args:
+            channel: the set channel (C1, C2)
+            fstart: start frequency (Hz)
+            fstop: stop frequency (Hz)
+            time_s: sweep time (s)
+            mode: sweep type (LIN only for SDG1000)
+        """
+        if mode.upper() != 'LIN':
+            raise ValueError(f"SDG1000 only supports LINEAR sweep. Got: {mode}")
+        self._validate_frequency(fstart)
+        self._validate_frequency(fstop)
+        self._write(f'{channel}:SWWV STATE,ON,STFR,{fstart},SPFR,{fstop},'
+                    f'TIME,{time_s},SWTP,LIN')
+
     def set_sweep(self, channel: str, state: str, start_freq: Optional[float] = None,
                   stop_freq: Optional[float] = None, sweep_time: Optional[float] = None, 
                   sweep_type: Optional[str] = None):
@@ -646,25 +850,26 @@ class SDG1000(VisaInstruments):
             raise ValueError(f"SDG1000 only supports LINEAR sweep. Got: {sweep_type}")
         
         # Enable/disable sweep
+        state = state.upper()
         write = f'{channel}:SWWV STATE,{state}'
-        self.instr.write(write)
+        self._write(write)
         
-        if state.upper() == 'ON':
+        if state == 'ON':
             # Set sweep parameters
             if start_freq:
                 self._validate_frequency(start_freq)
                 write = f'{channel}:SWWV STFR,{start_freq}'
-                self.instr.write(write)
+                self._write(write)
             if stop_freq:
                 self._validate_frequency(stop_freq)
                 write = f'{channel}:SWWV SPFR,{stop_freq}'
-                self.instr.write(write)
+                self._write(write)
             if sweep_time:
                 write = f'{channel}:SWWV TIME,{sweep_time}'
-                self.instr.write(write)
+                self._write(write)
             if sweep_type:
                 write = f'{channel}:SWWV SWTP,{sweep_type}'
-                self.instr.write(write)
+                self._write(write)
 
     def get_sweep_settings(self, channel: str):
         """
@@ -674,16 +879,12 @@ class SDG1000(VisaInstruments):
             channel: the set channel (C1, C2)
         """
         query = f'{channel}:SWWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
-        
-        # Parse sweep settings
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            if i + 1 < len(fields):
-                key = fields[i].strip()
-                value = fields[i + 1].strip()
-                instrument_dict[key.lower()] = value
+        response = self._query(query)
+        fields = _SPLIT.split(response.strip())
+
+        # Parse sweep settings by pairing even/odd fields
+        instrument_dict = {key.lower(): value for key, value
+                           in zip(fields[::2], fields[1::2])}
         
         return instrument_dict
 
@@ -705,12 +906,28 @@ class SDG1000(VisaInstruments):
             raise ValueError(f"Waveform data length {len(data)} exceeds SDG1000 limit "
                            f"({self.ARB_POINTS_MAX} points)")
         
-        # Convert data to comma-separated string
-        data_str = ','.join([str(point) for point in data])
-        
-        # Upload waveform data
-        write = f'{channel}:WVDT WVNM,{name},{data_str}'
-        self.instr.write(write)
+        # Bulk data goes out on its own, never chained into a batch
+        if self._pending:
+            self.flush()
+
+        # Scale float samples in [-1.0, 1.0] to full int16 range (the
+        # instrument truncates to its 12-bit DAC); int samples are sent
+        # as-is. With numpy the scaling/clipping/cast is one C pass.
+        if _np is not None:
+            arr = _np.asarray(data)
+            if arr.dtype.kind == 'f':
+                arr = _np.clip(arr * 32767.0, -32768, 32767)
+            data = arr.astype(_np.int16)
+        elif data and isinstance(data[0], float):
+            data = [max(-32768, min(32767, round(point * 32767.0)))
+                    for point in data]
+
+        # Transfer as an IEEE 488.2 binary block of little-endian int16:
+        # ~2 bytes per point on the wire instead of ~6 for ASCII, and no
+        # per-point str() formatting
+        header = f'{channel}:WVDT WVNM,{name},WAVEDATA,'
+        self.instr.write_binary_values(header, data, datatype='h',
+                                       is_big_endian=False)
         
         if sample_rate:
             write = f'{channel}:WVDT WVNM,{name},SMPL_RATE,{sample_rate}'
@@ -725,7 +942,7 @@ class SDG1000(VisaInstruments):
             name: waveform name
         """
         write = f'{channel}:ARWV NAME,{name}'
-        self.instr.write(write)
+        self._write(write)
     
     def delete_arbitrary_waveform(self, name: str):
         """
@@ -735,7 +952,7 @@ class SDG1000(VisaInstruments):
             name: waveform name to delete
         """
         write = f'WVDT DL,{name}'
-        self.instr.write(write)
+        self._write(write)
 
     def list_arbitrary_waveforms(self):
         """
@@ -744,34 +961,30 @@ class SDG1000(VisaInstruments):
         Returns:
             List of waveform names
         """
-        response = self.instr.query('STL?')
-        # Parse the response to extract waveform names
-        waveforms = []
-        if response:
-            # STL response format: "STL M1,SINE,M2,USER,..."
-            parts = response.replace('STL', '').strip().split(',')
-            for i in range(1, len(parts), 2):  # Skip indices, get names
-                if i < len(parts):
-                    waveforms.append(parts[i].strip())
-        return waveforms
-        self.instr.write(write)
-
-    def set_wave_low_level(self, channel: str, low_level: float):
+        response = self._query('STL?')
+        # STL response format: "STL M1,SINE,M2,USER,..." - the names sit
+        # at the odd positions of the payload
+        if not response:
+            return []
+        _, _, payload = response.partition(' ')
+        return [f.strip() for f in payload.split(',')][1::2]
+
+    def set_wave_low_level(self, channel: str, low_level: float, force: bool = False):
         """Can set low_level of set channel (same as SDG2000X)"""
-        write = f'{channel}:BSWV LLEV,{low_level}'
-        self.instr.write(write)
+        write = _BSWV_TEMPL[channel, 'LLEV'] + f'{low_level}'
+        self._apply(channel, 'BSWV', 'low_level', low_level, write, force)
 
-    def set_output_state(self, channel: str, state: str):
+    def set_output_state(self, channel: str, state: str, force: bool = False):
         """Can set output state of set channel (same as SDG2000X)"""
-        write = f'{channel}:OUTP {state}'
-        self.instr.write(write)
+        write = _OUTP_PREFIX[channel] + state
+        self._apply(channel, 'OUTP', 'state', state, write, force)
 
-    def set_output_polarity(self, channel: str, polarity: str):
+    def set_output_polarity(self, channel: str, polarity: str, force: bool = False):
         """Can set polarity output of set channel (same as SDG2000X)"""
-        write = f'{channel}:OUTP PLRT,{polarity}'
-        self.instr.write(write)
+        write = _OUTP_TEMPL[channel, 'PLRT'] + f'{polarity}'
+        self._apply(channel, 'OUTP', 'polarity', polarity, write, force)
 
     def set_arb_wave_type(self, channel, index: int):
         """Can sets arbitrary wave type by index (same as SDG2000X)"""
         write = f'{channel}:ARWV INDEX,{index}'
-        self.instr.write(write)
+        self._write(write)
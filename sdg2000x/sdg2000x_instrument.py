@@ -7,14 +7,124 @@ Class to manage SDG2000X instrument
 @contact: francesco.gramazio@lab3841.it
 '''
 
+import queue
+import re
+import sys
+import threading
 from typing import Union, Optional
+
+import pyvisa
 from visa_instruments import VisaInstruments
 
-class SDG2000X(VisaInstruments):   
+# numpy is optional; it only enables the vectorized fast path of
+# get_wave_info for poll loops
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+# Value parsers used by the dispatch tables below
+def _plain(value: str) -> str:
+    return value
+
+def _load_value(value: str):
+    if value == 'HZ':
+        return SDG2000X.HIGH_IMPEDANCE
+    return float(value)
+
+
+# Tokenizes a BSWV response in one pass: captures the SCPI token and the bare
+# value while the trailing unit (HZ, Vrms, dBm, V, S) is consumed outside the
+# groups, so no per-field str.replace scans are needed before float()
+_BSWV_RE = re.compile(
+    r'([A-Z_]+),'
+    r'([-+0-9.eE]+|[A-Z]+)'
+    r'(?:HZ|Vrms|dBm|V|S)?'
+    r'(?=,|$)'
+)
+
+# O(1) dispatch tables replacing the per-field if-chains in the response
+# parsers: SCPI token -> (result key, value parser). Units are already
+# stripped by _BSWV_RE, so numeric fields convert with plain float
+_BSWV_PARSE = {
+    'WVTP': ('type', _plain),
+    'FRQ': ('frequency', float),
+    'PERI': ('period', float),
+    'AMP': ('amplitude', float),
+    'AMPVRMS': ('amp_vrms', float),
+    'AMPDBM': ('amp_dbm', float),
+    'MAX_OUTPUT_AMP': ('max_output_amp', float),
+    'OFST': ('offset', float),
+    'HLEV': ('high_level', float),
+    'LLEV': ('low_level', float),
+    'PHSE': ('phase', float),
+    'DUTY': ('duty', float),
+    'BANDSTATE': ('bandstate', _plain),
+    'SYM': ('symmetry', float),
+    'WIDTH': ('width', float),
+    'RISE': ('rise', float),
+    'FALL': ('fall', float),
+    'DLY': ('delay', float),
+    'STDEV': ('stdev', float),
+    'MEAN': ('mean', float)
+}
+
+_OUTP_PARSE = {
+    'LOAD': ('load', _load_value),
+    'POWERON_STATE': ('poweron_state', float),
+    'PLRT': ('polarity', _plain)
+}
+
+# Splits on commas and swallows surrounding whitespace in one C-level
+# pass, replacing strip-per-field loops
+_SPLIT = re.compile(r'\s*,\s*')
+
+# Matches the 'Cn:OUTP state' header; a non-matching reply just leaves
+# 'state' out instead of tripping over a malformed split
+_OUTP_HEAD_RE = re.compile(r'C[12]:OUTP\s+(\w+)')
+
+# Single-pass lexer for the OUTP reply tail; one C-level finditer scan
+# replaces the split loop with its per-field strips
+_OUTP_RE = re.compile(r'(LOAD|POWERON_STATE|PLRT),\s*([^,;\s]+)')
+
+_ARWV_PARSE = {
+    'INDEX': ('index', int),
+    'NAME': ('name', _plain)
+}
+
+# Tokens each waveform type actually reports, per the programming guide.
+# Lets get_wave_info stop scanning once every expected field has been
+# collected instead of tokenizing the rest of the reply
+_AMPLITUDE_KEYS = frozenset({'AMP', 'AMPVRMS', 'AMPDBM', 'MAX_OUTPUT_AMP',
+                             'OFST', 'HLEV', 'LLEV'})
+_EXPECTED_KEYS = {
+    'SINE': frozenset({'FRQ', 'PERI', 'PHSE'}) | _AMPLITUDE_KEYS,
+    'SQUARE': frozenset({'FRQ', 'PERI', 'PHSE', 'DUTY'}) | _AMPLITUDE_KEYS,
+    'RAMP': frozenset({'FRQ', 'PERI', 'PHSE', 'SYM'}) | _AMPLITUDE_KEYS,
+    'PULSE': frozenset({'FRQ', 'PERI', 'DUTY', 'WIDTH', 'RISE', 'FALL',
+                        'DLY'}) | _AMPLITUDE_KEYS,
+    'NOISE': frozenset({'STDEV', 'MEAN', 'BANDSTATE'}),
+    'DC': frozenset({'OFST'}),
+    'ARB': frozenset({'FRQ', 'PERI', 'PHSE'}) | _AMPLITUDE_KEYS
+}
+
+# Channel command prefixes, prebuilt and interned once so the setters
+# concatenate a constant instead of rebuilding 'Cn:BSWV ' / 'Cn:OUTP '
+# with an f-string on every call
+_BSWV_PREFIX = {c: sys.intern(f'{c}:BSWV ') for c in ('C1', 'C2')}
+_OUTP_PREFIX = {c: sys.intern(f'{c}:OUTP ') for c in ('C1', 'C2')}
+
+
+class SDG2000X(VisaInstruments):
     '''
     SDG2000X instrument
     '''
 
+    # Same layout as VisaInstruments so the factory can specialize a
+    # detection session in place with a __class__ assignment
+    __slots__ = ()
+
     CHANNEL1 = 'C1'
     CHANNEL2 = 'C2'
     WAVEFORM_SINE = 'SINE'
@@ -29,329 +139,425 @@ class SDG2000X(VisaInstruments):
     HIGH_IMPEDANCE = 0
     POLARITY_INVERTED = 'INVT'
     POLARITY_NORMAL = 'NOR'
-        
-    def get_output_state(self, channel: str):
-        '''
-        Returns the output state, load and polarity parameters 
-        value of the set channel
-        
-        Args:
-        channel: the set channel
-        '''
 
-        query = f'{channel}:OUTP?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')       
-        
-        # creates a dictionary
-        instrument_dict = {}
-        first = fields[0].strip().split(' ')
-        if len(first) == 2:
-            key, value = first
-        if key in ('C1:OUTP', 'C2:OUTP'):
-            instrument_dict['state'] = value
-
-        rest = fields[1:]       
-        for i in range(0, len(rest) - 1, 2):
-            key = rest[i].strip()
-            value = rest[i + 1].strip()
-
-            if key == 'LOAD':
-                if value == 'HZ':
-                    instrument_dict['load'] = SDG2000X.HIGH_IMPEDANCE
-                else:
-                    instrument_dict['load'] = float(value)
-            if key == 'POWERON_STATE':
-                instrument_dict['poweron_state'] = float(value)
-            if key == 'PLRT':
-                instrument_dict['polarity'] = value
+    # Maps set_wave keyword names to BSWV SCPI tokens
+    _WAVE_PARAMS = {
+        'type': 'WVTP',
+        'frequency': 'FRQ',
+        'period': 'PERI',
+        'amplitude': 'AMP',
+        'offset': 'OFST',
+        'symmetry': 'SYM',
+        'duty': 'DUTY',
+        'phase': 'PHSE',
+        'stdev': 'STDEV',
+        'mean': 'MEAN',
+        'width': 'WIDTH',
+        'rise': 'RISE',
+        'fall': 'FALL',
+        'delay': 'DLY',
+        'high_level': 'HLEV',
+        'low_level': 'LLEV'
+    }
+
+    def __init__(self, address, background_writes: bool = False):
+        '''
+        Init SDG2000X instrument
+
+        Binds the pyvisa write/query bound methods once so the hot
+        setter/getter paths skip the .instr attribute lookup per call
+
+        Args:
+        address: VISA address of the instrument
+        background_writes: hand writes to a daemon writer thread so
+            set_* calls return immediately; queries wait for the queue
+            to drain first, keeping command ordering intact
+        '''
+        super().__init__(address)
+        self._post_rebind()
+        if background_writes:
+            self._write_q = queue.Queue()
+            self._write = self._write_q.put
+            self._query = self._drained_query
+            threading.Thread(target=self._writer_loop, daemon=True).start()
+
+    def _post_rebind(self):
+        '''
+        Sets up the SDG2000X per-instance state (also run when the
+        factory re-binds a detection session to this class)
+        '''
+        # Stand-ins until the lazy session opens; _on_open swaps in the
+        # real bound methods
+        self._write = self._first_write
+        self._query = self._first_query
+        # Parsed query replies keyed by (channel, command); each setter
+        # invalidates the entry for the command it writes, so repeated
+        # getters between writes skip the VISA round-trip
+        self._cache = {}
+        # Write queue used in batch mode (None when batching is off);
+        # keyed so a newer write to the same setting replaces the older
+        # one before anything goes on the wire
+        self._pending = None
+        # No background writer unless __init__ starts one
+        self._write_q = None
+        # A factory detection session is already open at this point, so
+        # the _on_open hook will not fire again — tune and bind now
+        if self._instr is not None:
+            self._on_open()
+
+    def _on_open(self):
+        '''
+        Tunes the fresh session and binds its write/query fast paths
+        (runs on first use and again after reconnect)
+        '''
+        self._tune_transport()
+        if self._write_q is None:
+            self._write = self.instr.write
+            self._query = self.instr.query
+
+    def _first_write(self, command):
+        '''Opens the session, which re-binds _write, then delegates'''
+        self.open()
+        self._write(command)
+
+    def _first_query(self, command):
+        '''Opens the session, which re-binds _query, then delegates'''
+        self.open()
+        return self._query(command)
+
+    def close(self):
+        '''
+        Closes the session and restores the lazy stand-ins, so a later
+        command re-opens and re-binds cleanly
+        '''
+        super().close()
+        if self._write_q is None:
+            self._write = self._first_write
+            self._query = self._first_query
+
+    def _tune_transport(self):
+        '''
+        Applies the SDG2000X transport tuning to the open session
+        '''
+        # Disabling Nagle on TCPIP transports stops large binary uploads
+        # from stalling on the delayed-ACK interaction; other transports
+        # (or backends without the attribute) simply skip it
+        if self.address.startswith('TCPIP'):
+            try:
+                self.instr.set_visa_attribute(
+                    pyvisa.constants.VI_ATTR_TCPIP_NODELAY, True)
+            except Exception:
+                pass
 
-        return instrument_dict
-    
-    def get_wave_info(self, channel: str):
+    def reconnect(self, retries: int = 3, backoff: float = 0.5):
         '''
-        Returns wave information of the set channel
-
-        Args:
-        channel: the set channel
+        Rebuilds the session; _on_open re-applies the transport tuning
+        and re-binds the cached write/query methods
         '''
-        query = f'{channel}:BSWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
+        super().reconnect(retries, backoff)
+        # Everything cached belonged to the old session's conversation
+        self._cache.clear()
 
-        # creates a dictionary
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            key = fields[i].strip()
-            value = fields[i + 1].strip()
-
-            if key in ('C1:BSWV WVTP', 'C2:BSWV WVTP'):
-                instrument_dict['type'] = value
-            if key == 'FRQ':
-                instrument_dict['frequency'] = float(value.replace('HZ', ''))
-            if key == 'PERI':
-                instrument_dict['period'] = float(value.replace('S', ''))
-            if key == 'AMP':
-                instrument_dict['amplitude'] = float(value.replace('V', ''))
-            if key == 'AMPVRMS':
-                instrument_dict['amp_vrms'] = float(value.replace('Vrms', ''))
-            if key == 'AMPDBM':
-                instrument_dict['amp_dbm'] = float(value.replace('dBm', ''))
-            if key == 'MAX_OUTPUT_AMP':
-                instrument_dict['max_output_amp'] = float(value.replace('V', ''))
-            if key == 'OFST':
-                instrument_dict['offset'] = float(value.replace('V', ''))
-            if key == 'HLEV':
-                instrument_dict['high_level'] = float(value.replace('V', ''))
-            if key == 'LLEV':
-                instrument_dict['low_level'] = float(value.replace('V', ''))
-            if key == 'PHSE':
-                instrument_dict['phase'] = float(value)
-            if key == 'DUTY':
-                instrument_dict['duty'] = float(value)
-            if key == 'BANDSTATE':
-                instrument_dict['bandstate'] = value
-            if key == 'SYM':
-                instrument_dict['symmetry'] = float(value)
-            if key == 'WIDTH':
-                instrument_dict['width'] = float(value)
-            if key == 'RISE':
-                instrument_dict['rise'] = float(value.replace('S', ''))
-            if key == 'FALL':
-                instrument_dict['fall'] = float(value.replace('S', ''))
-            if key == 'DLY':
-                instrument_dict['delay'] = float(value)
-            if key == 'STDEV':
-                instrument_dict['stdev'] = float(value.replace('V', ''))
-            if key == 'MEAN':
-                instrument_dict['mean'] = float(value.replace('V', ''))
-
-        return instrument_dict
-    
-    def get_store_list(self):
+    def _writer_loop(self):
         '''
-        Used to read the stored wave data names
+        Consumes queued commands and pushes them onto the wire
         '''
-        query = 'STL?'
-        response = self.instr.query(query)
-        fields = response.replace('STL','').split(',')
-        
-        # creates a dictionary
-        instrument_dict = {}
-        counts = 0
-        
-        for i in range(0, len(fields) - 1, 2):
-            counts += 1
-            key = fields[i].strip()
-            value = fields[i + 1].strip()
-            instrument_dict[int(key.replace('M', ''))] = value
+        while True:
+            command = self._write_q.get()
+            try:
+                self.instr.write(command)
+            finally:
+                self._write_q.task_done()
 
-        return dict(sorted(instrument_dict.items()))
-    
-    def get_arb_wave_type(self, channel):
+    def _drained_query(self, command):
         '''
-        Return arb wave type of the set channel
-
-        Args:
-        channel: the set channel (C1, C2)
+        Waits for every queued write to reach the instrument, then
+        queries; replaces the direct query binding in background mode
         '''
-        query = f'{channel}:ARWV?'
-        response = self.instr.query(query)
+        self._write_q.join()
+        return self.instr.query(command)
 
-        response = self.instr.query(query)
-        if channel == SDG2000X.CHANNEL1:
-            fields = response.replace('C1:ARWV','').split(',')
-        elif channel == SDG2000X.CHANNEL2:
-            fields = response.replace('C2:ARWV','').split(',')
+    def begin_batch(self):
+        '''
+        Starts queueing setter writes instead of sending them immediately
 
-        # creates a dictionary
-        instrument_dict = {}
-        for i in range(0, len(fields) - 1, 2):
-            key = fields[i].strip()
-            value = fields[i + 1].strip()
+        While batching, a newer write to the same (channel, command,
+        parameter) replaces a still-queued older one, so only the latest
+        value is transmitted. Queued writes go out as one compound SCPI
+        message on flush(); any query flushes automatically first so
+        ordering is preserved.
+        '''
+        if self._pending is None:
+            self._pending = {}
 
-            if key == 'INDEX':
-                instrument_dict['index'] = int(value)
-            if key == 'NAME':
-                instrument_dict['name'] = value
+    def flush(self):
+        '''
+        Sends every queued write as a single ';'-chained SCPI message
 
-        return instrument_dict
+        Batch mode stays active; call it again after queueing more writes.
+        '''
+        if self._pending:
+            self._write(';'.join(self._pending.values()))
+            self._pending.clear()
 
-    def set_waveform(self, channel: str, type):
+    def _enqueue(self, key, command):
         '''
-        Can set waveform of set channel
-        
-        Args:
-        channel: the set channel (C1, C2)
-        type: type of waveform (SINE, SQUARE, RAMP, PULSE, NOISE, DC, ARB)
+        Sends the command directly, or queues it when batching; a queued
+        command with the same key is dropped and re-inserted at the end
+        so the newest value keeps its transmission order
         '''
-        write = f'{channel}:BSWV WVTP,{type}'
-        self.instr.write(write)
+        if self._pending is None:
+            self._write(command)
+        else:
+            self._pending.pop(key, None)
+            self._pending[key] = command
 
-    def set_wave_frequency(self, channel: str, frequency: float):
+    def set_wave(self, channel: str, **params):
         '''
-        Can set frequency of set channel
+        Can set several wave parameters of set channel in a single write
+
+        The BSWV command accepts multiple KEY,VALUE pairs per message, so
+        batching e.g. frequency, amplitude and offset pays one VISA
+        round-trip instead of one per parameter.
 
         Args:
         channel: the set channel (C1, C2)
-        frequency: wave frequency (Hz)        
+        params: wave parameters by keyword (type, frequency, period,
+            amplitude, offset, symmetry, duty, phase, stdev, mean, width,
+            rise, fall, delay, high_level, low_level)
         '''
-        write = f'{channel}:BSWV FRQ,{frequency}'
-        self.instr.write(write)
+        if not params:
+            return
 
-    def set_wave_period(self, channel: str, period: float):
-        '''
-        Can set period of set channel
+        try:
+            body = ','.join(f'{SDG2000X._WAVE_PARAMS[name]},{value}'
+                            for name, value in params.items())
+        except KeyError as e:
+            raise ValueError(f'Unknown wave parameter: {e.args[0]}')
 
-        Args:
-        channel: the set channel (C1, C2)
-        period: wave period (s)        
-        '''
-        write = f'{channel}:BSWV PERI,{period}'
-        self.instr.write(write)
+        self._cache.pop((channel, 'BSWV'), None)
+        self._enqueue((channel, 'BSWV') + tuple(params), _BSWV_PREFIX[channel] + body)
 
-    def set_wave_amplitude(self, channel: str, amplitude: float):
-        '''
-        Can set amplitude of set channel
+    # Both names are in use for the coalesced multi-parameter write; the
+    # single-parameter setters below already issue exactly one BSWV write
+    # each, so they do not delegate through here
+    set_wave_params = set_wave
 
-        Args:
-        channel: the set channel (C1, C2)
-        amplitude: wave amplitude (V)        
+    def configure_wave(self, channel: str, *, waveform: str = None, **params):
         '''
-        write = f'{channel}:BSWV AMP,{amplitude}'
-        self.instr.write(write)
+        Fused multi-parameter setter matching the SDG1000 entry point
 
-    def set_wave_offset(self, channel: str, offset: float):
+        Thin wrapper over set_wave() that accepts the type under the
+        waveform= keyword; everything else passes through unchanged
         '''
-        Can set offset of set channel
+        if waveform is not None:
+            # The type pair must lead the compound: switching waveforms
+            # resets the other parameters, so they have to follow it
+            params = {'type': waveform, **params}
+        self.set_wave(channel, **params)
 
-        Args:
-        channel: the set channel (C1, C2)
-        offset: wave offset (V)        
+    def reset(self):
         '''
-        write = f'{channel}:BSWV OFST,{offset}'
-        self.instr.write(write)
-
-    def set_wave_symmetry(self, channel: str, symmetry: float):
+        Resets the instrument and drops every cached reply
         '''
-        Can set symmetry of set channel
+        if self._pending:
+            self.flush()
+        self._cache.clear()
+        super().reset()
 
+    def get_output_state(self, channel: str):
+        '''
+        Returns the output state, load and polarity parameters 
+        value of the set channel
+        
         Args:
-        channel: the set channel (C1, C2)
-        symmetry: wave symmetry (%)        
+        channel: the set channel
         '''
-        write = f'{channel}:BSWV SYM,{symmetry}'
-        self.instr.write(write)
 
-    def set_wave_duty(self, channel: str, duty):
-        '''
-        Can set duty of set channel
+        cached = self._cache.get((channel, 'OUTP'))
+        if cached is not None:
+            return cached
 
-        Args:
-        channel: the set channel (C1, C2)
-        duty: wave duty (%)        
-        '''
-        write = f'{channel}:BSWV DUTY,{duty}'
-        self.instr.write(write)
+        if self._pending:
+            self.flush()
+        query = f'{channel}:OUTP?'
+        response = self._query(query)
+        result = self._parse_outp(response)
+        self._cache[(channel, 'OUTP')] = result
+        return result
 
-    def set_wave_phase(self, channel: str, phase: float):
+    def get_both_output_states(self):
         '''
-        Can set phase of set channel
+        Returns the output state, load and polarity parameters of both
+        channels in a single VISA transaction
 
-        Args:
-        channel: the set channel (C1, C2)
-        phase: wave phase (°)        
+        The two OUTP? queries are chained with ';' so the device answers
+        both in one reply and only one bus turnaround is paid.
         '''
-        write = f'{channel}:BSWV PHSE,{phase}'
-        self.instr.write(write)
+        if self._pending:
+            self.flush()
+        response = self._query('C1:OUTP?;C2:OUTP?')
+        parts = response.strip().split(';')
+        result = {'C1': self._parse_outp(parts[0]),
+                  'C2': self._parse_outp(parts[1]) if len(parts) > 1 else {}}
+        self._cache[('C1', 'OUTP')] = result['C1']
+        self._cache[('C2', 'OUTP')] = result['C2']
+        return result
 
-    def set_wave_stdev(self, channel: str, stdev: float):
+    @staticmethod
+    def _parse_outp(response: str):
         '''
-        Can set stdev of set channel
-
-        Args:
-        channel: the set channel (C1, C2)
-        stdev: wave stdev (V)        
+        Parses a single 'Cn:OUTP state,...' reply into a dictionary
         '''
-        write = f'{channel}:BSWV STDEV,{stdev}'
-        self.instr.write(write)
+        # creates a dictionary; the state rides on the 'Cn:OUTP ' header,
+        # the rest is lexed in one regex pass
+        instrument_dict = {}
+        head = _OUTP_HEAD_RE.match(response.strip())
+        if head:
+            instrument_dict['state'] = head.group(1)
 
-    def set_wave_mean(self, channel: str, mean: float):
-        '''
-        Can set mean of set channel
+        for key, value in _OUTP_RE.findall(response):
+            name, parser = _OUTP_PARSE[key]
+            instrument_dict[name] = parser(value)
 
-        Args:
-        channel: the set channel (C1, C2)
-        mean: wave mean (V)                
-        '''
-        write = f'{channel}:BSWV MEAN,{mean}'
-        self.instr.write(write)
+        return instrument_dict
 
-    def set_wave_width(self, channel: str, width: float):
+    def get_wave_info(self, channel: str, fast: bool = False):
         '''
-        Can set width of set channel
+        Returns wave information of the set channel
 
         Args:
-        channel: the set channel (C1, C2)
-        width: wave widht (Hz)        
+        channel: the set channel
+        fast: convert all numeric fields in one vectorized numpy pass
+            instead of one float() per field; worth it when polling
+            wave info in a tight loop (requires numpy)
         '''
-        write = f'{channel}:BSWV WIDTH,{width}'
-        self.instr.write(write)
+        cached = self._cache.get((channel, 'BSWV'))
+        if cached is not None:
+            return cached
 
-    def set_wave_rise(self, channel: str, rise: float):
-        '''
-        Can set rise of set channel
+        if self._pending:
+            self.flush()
+        query = f'{channel}:BSWV?'
+        response = self._query(query)
 
-        Args:
-        channel: the set channel (C1, C2)
-        rise: wave rise (s) 
-        '''
-        write = f'{channel}:BSWV RISE,{rise}'
-        self.instr.write(write)
+        if fast and _np is not None:
+            result = self._parse_bswv_fast(response)
+            self._cache[(channel, 'BSWV')] = result
+            return result
 
-    def set_wave_fall(self, channel: str, fall: float):
-        '''
-        Can set fall of set channel
+        # creates a dictionary in a single tokenizer pass; the 'Cn:BSWV '
+        # header never matches because the token must be followed by a comma.
+        # Once the waveform type is known, the scan stops as soon as every
+        # field that type reports has been collected
+        instrument_dict = {}
+        remaining = None
+        for match in _BSWV_RE.finditer(response):
+            key, value = match.groups()
+            name, parser = _BSWV_PARSE.get(key, (None, None))
+            if not name:
+                continue
+            instrument_dict[name] = parser(value)
+
+            if remaining is not None:
+                remaining.discard(key)
+                if not remaining:
+                    break
+            elif key == 'WVTP':
+                expected = _EXPECTED_KEYS.get(value)
+                if expected:
+                    remaining = set(expected)
+
+        self._cache[(channel, 'BSWV')] = instrument_dict
+        return instrument_dict
 
-        Args:
-        channel: the set channel (C1, C2)
-        fall: wave fall (s) 
+    @staticmethod
+    def _parse_bswv_fast(response: str):
         '''
-        write = f'{channel}:BSWV FALL,{fall}'
-        self.instr.write(write)
-
-    def set_wave_delay(self, channel: str, delay: float):
+        Vectorized BSWV parse: collects the numeric value substrings and
+        converts them with a single numpy fromstring call instead of one
+        float() per field
         '''
-        Can set delay of set channel
+        instrument_dict = {}
+        numeric_names = []
+        numeric_values = []
+        for key, value in _BSWV_RE.findall(response):
+            name, parser = _BSWV_PARSE.get(key, (None, None))
+            if name is None:
+                continue
+            if parser is float:
+                numeric_names.append(name)
+                numeric_values.append(value)
+            else:
+                instrument_dict[name] = parser(value)
+
+        if numeric_values:
+            converted = _np.fromstring(','.join(numeric_values), sep=',')
+            instrument_dict.update(zip(numeric_names, converted))
 
-        Args:
-        channel: the set channel (C1, C2)
-        delay: wave delay (s) 
+        return instrument_dict
+    
+    def _stl(self):
         '''
-        write = f'{channel}:BSWV DLY,{delay}'
-        self.instr.write(write)
-
-    def set_wave_high_level(self, channel: str, high_level: float):
+        Returns the raw STL? reply, cached until an arbitrary waveform
+        is uploaded or deleted so get_store_list and
+        list_arbitrary_waveforms share one query
         '''
-        Can set high_level of set channel
+        response = self._cache.get('STL')
+        if response is None:
+            if self._pending:
+                self.flush()
+            response = self._query('STL?')
+            self._cache['STL'] = response
+        return response
 
-        Args:
-        channel: the set channel (C1, C2)
-        high_level: wave high_level (V) 
+    def get_store_list(self):
+        '''
+        Used to read the stored wave data names
         '''
-        write = f'{channel}:BSWV HLEV,{high_level}'
-        self.instr.write(write)
+        response = self._stl()
 
-    def set_wave_low_level(self, channel: str, low_level: float):
+        # header is 'STL '; slice it off, then pair the index/name fields
+        # by slicing instead of an index-stepped loop
+        _, _, payload = response.partition(' ')
+        fields = [f.strip() for f in payload.split(',')]
+        instrument_dict = {int(k.lstrip('M')): v
+                           for k, v in zip(fields[::2], fields[1::2])}
+        return dict(sorted(instrument_dict.items()))
+    
+    def get_arb_wave_type(self, channel):
         '''
-        Can set low_level of set channel
+        Return arb wave type of the set channel
 
         Args:
         channel: the set channel (C1, C2)
-        low_level: wave low_level (V) 
         '''
-        write = f'{channel}:BSWV LLEV,{low_level}'
-        self.instr.write(write)
+        cached = self._cache.get((channel, 'ARWV'))
+        if cached is not None:
+            return cached
+
+        if self._pending:
+            self.flush()
+        query = f'{channel}:ARWV?'
+        response = self._query(query)
+
+        # header is 'Cn:ARWV '; everything after the first space is payload,
+        # so no per-channel branch or replace scan is needed
+        _, _, payload = response.partition(' ')
+        fields = payload.split(',')
+
+        # creates a dictionary
+        instrument_dict = {}
+        for i in range(0, len(fields) - 1, 2):
+            key = fields[i].strip()
+            value = fields[i + 1].strip()
+
+            name, parser = _ARWV_PARSE.get(key, (None, None))
+            if name:
+                instrument_dict[name] = parser(value)
+
+        self._cache[(channel, 'ARWV')] = instrument_dict
+        return instrument_dict
 
     def set_output_state(self, channel: str, state: str):
         '''
@@ -361,8 +567,8 @@ class SDG2000X(VisaInstruments):
         channel: the set channel (C1, C2)
         state: output state (ON, OFF)
         '''
-        write = f'{channel}:OUTP {state}'
-        self.instr.write(write)
+        self._cache.pop((channel, 'OUTP'), None)
+        self._enqueue((channel, 'OUTP', 'STATE'), _OUTP_PREFIX[channel] + state)
 
     def set_output_load(self, channel: str, load: Union[str, int]):
         '''
@@ -372,12 +578,11 @@ class SDG2000X(VisaInstruments):
         channel: the set channel (C1, C2)
         load: output load (50~10000, HZ)
         '''
+        self._cache.pop((channel, 'OUTP'), None)
         if load == SDG2000X.HIGH_IMPEDANCE:
-            write = f'{channel}:OUTP LOAD, HZ'
+            self._enqueue((channel, 'OUTP', 'LOAD'), _OUTP_PREFIX[channel] + 'LOAD, HZ')
         else:
-            write = f'{channel}:OUTP LOAD, {load}'
-        
-        self.instr.write(write)
+            self._enqueue((channel, 'OUTP', 'LOAD'), _OUTP_PREFIX[channel] + f'LOAD, {load}')
 
     def set_output_polarity(self, channel: str, polarity: str):
 
@@ -388,8 +593,8 @@ class SDG2000X(VisaInstruments):
         channel: the set channel (C1, C2)
         polarity: output polarity (INVT, NOR)
         '''
-        write = f'{channel}:OUTP PLRT, {polarity}'
-        self.instr.write(write)
+        self._cache.pop((channel, 'OUTP'), None)
+        self._enqueue((channel, 'OUTP', 'PLRT'), _OUTP_PREFIX[channel] + f'PLRT, {polarity}')
 
     def set_arb_wave_type(self, channel, index: int):
         '''
@@ -399,8 +604,8 @@ class SDG2000X(VisaInstruments):
         channel: the set channel (C1, C2)
         index: index of arbitrary wave
         '''
-        write = f'{channel}:ARWV INDEX, {index}'
-        self.instr.write(write)
+        self._cache.pop((channel, 'ARWV'), None)
+        self._enqueue((channel, 'ARWV', 'INDEX'), f'{channel}:ARWV INDEX, {index}')
     
     # Advanced modulation methods
     def set_modulation(self, channel: str, state: str, mod_type: Optional[str] = None, 
@@ -415,22 +620,26 @@ class SDG2000X(VisaInstruments):
             frequency: modulation frequency
             depth: modulation depth
         '''
-        # Enable/disable modulation
-        write = f'{channel}:MDWV STATE,{state}'
-        self.instr.write(write)
-        
-        if state.upper() == 'ON' and mod_type:
-            # Set modulation type and parameters
-            if mod_type:
-                write = f'{channel}:MDWV {mod_type}'
-                if frequency:
-                    write += f',FRQ,{frequency}'
-                if depth:
-                    if mod_type == 'AM':
-                        write += f',DEPTH,{depth}'
-                    elif mod_type == 'FM':
-                        write += f',DEVI,{depth}'
-                self.instr.write(write)
+        if self._pending:
+            self.flush()
+        self._cache.pop((channel, 'MDWV'), None)
+
+        # Chains the state and parameter commands with ';' so the whole
+        # update goes out as one message instead of one write each
+        state = state.upper()
+        prefix = f'{channel}:MDWV '
+        parts = [prefix + f'STATE,{state}']
+        if state == 'ON' and mod_type:
+            write = prefix + mod_type
+            if frequency:
+                write += f',FRQ,{frequency}'
+            if depth:
+                if mod_type == 'AM':
+                    write += f',DEPTH,{depth}'
+                elif mod_type == 'FM':
+                    write += f',DEVI,{depth}'
+            parts.append(write)
+        self._write(';'.join(parts))
     
     def get_modulation_settings(self, channel: str):
         '''
@@ -439,18 +648,21 @@ class SDG2000X(VisaInstruments):
         Args:
             channel: the set channel (C1, C2)
         '''
+        cached = self._cache.get((channel, 'MDWV'))
+        if cached is not None:
+            return cached
+
+        if self._pending:
+            self.flush()
         query = f'{channel}:MDWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
-        
-        # Parse modulation settings
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            if i + 1 < len(fields):
-                key = fields[i].strip()
-                value = fields[i + 1].strip()
-                instrument_dict[key.lower()] = value
-        
+        response = self._query(query)
+        fields = _SPLIT.split(response.strip())
+
+        # Parse modulation settings by pairing even/odd fields
+        instrument_dict = {key.lower(): value for key, value
+                           in zip(fields[::2], fields[1::2])}
+
+        self._cache[(channel, 'MDWV')] = instrument_dict
         return instrument_dict
     
     # Burst mode methods
@@ -466,21 +678,22 @@ class SDG2000X(VisaInstruments):
             period: burst period
             trigger_source: trigger source (MAN, CH1, CH2, EXT)
         '''
-        # Enable/disable burst
-        write = f'{channel}:BTWV STATE,{state}'
-        self.instr.write(write)
-        
-        if state.upper() == 'ON':
-            # Set burst parameters
+        if self._pending:
+            self.flush()
+        self._cache.pop((channel, 'BTWV'), None)
+
+        # Chains every burst parameter into one ';'-separated message
+        state = state.upper()
+        prefix = f'{channel}:BTWV '
+        parts = [prefix + f'STATE,{state}']
+        if state == 'ON':
             if n_cycle:
-                write = f'{channel}:BTWV GATE_NCYC,{n_cycle}'
-                self.instr.write(write)
+                parts.append(prefix + f'GATE_NCYC,{n_cycle}')
             if period:
-                write = f'{channel}:BTWV PRD,{period}'
-                self.instr.write(write)
+                parts.append(prefix + f'PRD,{period}')
             if trigger_source:
-                write = f'{channel}:BTWV TRSR,{trigger_source}'
-                self.instr.write(write)
+                parts.append(prefix + f'TRSR,{trigger_source}')
+        self._write(';'.join(parts))
     
     def get_burst_settings(self, channel: str):
         '''
@@ -489,21 +702,47 @@ class SDG2000X(VisaInstruments):
         Args:
             channel: the set channel (C1, C2)
         '''
+        cached = self._cache.get((channel, 'BTWV'))
+        if cached is not None:
+            return cached
+
+        if self._pending:
+            self.flush()
         query = f'{channel}:BTWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
-        
-        # Parse burst settings
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            if i + 1 < len(fields):
-                key = fields[i].strip()
-                value = fields[i + 1].strip()
-                instrument_dict[key.lower()] = value
-        
+        response = self._query(query)
+        fields = _SPLIT.split(response.strip())
+
+        # Parse burst settings by pairing even/odd fields
+        instrument_dict = {key.lower(): value for key, value
+                           in zip(fields[::2], fields[1::2])}
+
+        self._cache[(channel, 'BTWV')] = instrument_dict
         return instrument_dict
     
     # Sweep methods
+    def configure_sweep(self, channel: str, fstart: float, fstop: float,
+                        time_s: float, mode: str = 'LIN'):
+        '''
+        Starts the instrument's internal frequency sweep with one write
+
+        The DDS steps the frequency on its own timebase, so this
+        replaces any Python loop over set_wave_frequency — N round
+        trips collapse into a single compound SWWV command and the
+        effective slew is limited by the instrument, not the PC.
+
+        Args:
+            channel: the set channel (C1, C2)
+            fstart: start frequency (Hz)
+            fstop: stop frequency (Hz)
+            time_s: sweep time (s)
+            mode: sweep type (LIN, LOG)
+        '''
+        if self._pending:
+            self.flush()
+        self._cache.pop((channel, 'SWWV'), None)
+        self._write(f'{channel}:SWWV STATE,ON,STFR,{fstart},SPFR,{fstop},'
+                    f'TIME,{time_s},SWTP,{mode.upper()}')
+
     def set_sweep(self, channel: str, state: str, start_freq: Optional[float] = None,
                   stop_freq: Optional[float] = None, sweep_time: Optional[float] = None, 
                   sweep_type: Optional[str] = None):
@@ -518,24 +757,24 @@ class SDG2000X(VisaInstruments):
             sweep_time: sweep time
             sweep_type: sweep type (LIN, LOG)
         '''
-        # Enable/disable sweep
-        write = f'{channel}:SWWV STATE,{state}'
-        self.instr.write(write)
-        
-        if state.upper() == 'ON':
-            # Set sweep parameters
+        if self._pending:
+            self.flush()
+        self._cache.pop((channel, 'SWWV'), None)
+
+        # Chains every sweep parameter into one ';'-separated message
+        state = state.upper()
+        prefix = f'{channel}:SWWV '
+        parts = [prefix + f'STATE,{state}']
+        if state == 'ON':
             if start_freq:
-                write = f'{channel}:SWWV STFR,{start_freq}'
-                self.instr.write(write)
+                parts.append(prefix + f'STFR,{start_freq}')
             if stop_freq:
-                write = f'{channel}:SWWV SPFR,{stop_freq}'
-                self.instr.write(write)
+                parts.append(prefix + f'SPFR,{stop_freq}')
             if sweep_time:
-                write = f'{channel}:SWWV TIME,{sweep_time}'
-                self.instr.write(write)
+                parts.append(prefix + f'TIME,{sweep_time}')
             if sweep_type:
-                write = f'{channel}:SWWV SWTP,{sweep_type}'
-                self.instr.write(write)
+                parts.append(prefix + f'SWTP,{sweep_type}')
+        self._write(';'.join(parts))
     
     def get_sweep_settings(self, channel: str):
         '''
@@ -544,18 +783,21 @@ class SDG2000X(VisaInstruments):
         Args:
             channel: the set channel (C1, C2)
         '''
+        cached = self._cache.get((channel, 'SWWV'))
+        if cached is not None:
+            return cached
+
+        if self._pending:
+            self.flush()
         query = f'{channel}:SWWV?'
-        response = self.instr.query(query)
-        fields = response.strip().split(',')
-        
-        # Parse sweep settings
-        instrument_dict = {}
-        for i in range(0, len(fields), 2):
-            if i + 1 < len(fields):
-                key = fields[i].strip()
-                value = fields[i + 1].strip()
-                instrument_dict[key.lower()] = value
-        
+        response = self._query(query)
+        fields = _SPLIT.split(response.strip())
+
+        # Parse sweep settings by pairing even/odd fields
+        instrument_dict = {key.lower(): value for key, value
+                           in zip(fields[::2], fields[1::2])}
+
+        self._cache[(channel, 'SWWV')] = instrument_dict
         return instrument_dict
     
     # Arbitrary waveform methods
@@ -563,23 +805,49 @@ class SDG2000X(VisaInstruments):
                                   sample_rate: Optional[float] = None):
         '''
         Upload arbitrary waveform data
-        
+
+        The samples are transferred as an IEEE 488.2 binary block of
+        little-endian int16 values instead of comma-separated ASCII,
+        which cuts the payload by 5-10x for long waveforms and skips
+        the per-point str() formatting.
+
         Args:
             channel: the set channel (C1, C2)
             name: waveform name
-            data: waveform data points (list of values)
+            data: waveform data points; int16 DAC codes, or floats in
+                [-1.0, 1.0] which are scaled to full range (with numpy
+                the scaling/clipping/cast runs as one C pass)
             sample_rate: sample rate
         '''
-        # Convert data to comma-separated string
-        data_str = ','.join([str(point) for point in data])
-        
-        # Upload waveform data
-        write = f'{channel}:WVDT WVNM,{name},{data_str}'
-        self.instr.write(write)
-        
+        if self._pending:
+            self.flush()
+        if self._write_q is not None:
+            self._write_q.join()
+        self._cache.pop('STL', None)
+
+        if _np is not None:
+            arr = _np.asarray(data)
+            if arr.dtype.kind == 'f':
+                arr = _np.clip(arr * 32767.0, -32768, 32767)
+            data = arr.astype(_np.int16)
+        elif data and isinstance(data[0], float):
+            data = [max(-32768, min(32767, round(point * 32767.0)))
+                    for point in data]
+
+        # Make sure the whole block fits one write buffer; a payload
+        # larger than chunk_size would be re-segmented on the wire
+        needed = 2 * len(data) + 128
+        if needed > self.instr.chunk_size:
+            self.instr.chunk_size = needed
+
+        # Upload waveform data as a binary block
+        header = f'{channel}:WVDT WVNM,{name},WAVEDATA,'
+        self.instr.write_binary_values(header, data, datatype='h',
+                                       is_big_endian=False)
+
         if sample_rate:
             write = f'{channel}:WVDT WVNM,{name},SMPL_RATE,{sample_rate}'
-            self.instr.write(write)
+            self._write(write)
     
     def select_arbitrary_waveform(self, channel: str, name: str):
         '''
@@ -589,8 +857,8 @@ class SDG2000X(VisaInstruments):
             channel: the set channel (C1, C2)
             name: waveform name
         '''
-        write = f'{channel}:ARWV NAME,{name}'
-        self.instr.write(write)
+        self._cache.pop((channel, 'ARWV'), None)
+        self._enqueue((channel, 'ARWV', 'NAME'), f'{channel}:ARWV NAME,{name}')
     
     def delete_arbitrary_waveform(self, name: str):
         '''
@@ -599,8 +867,10 @@ class SDG2000X(VisaInstruments):
         Args:
             name: waveform name to delete
         '''
-        write = f'WVDT DL,{name}'
-        self.instr.write(write)
+        if self._pending:
+            self.flush()
+        self._cache.pop('STL', None)
+        self._write(f'WVDT DL,{name}')
     
     def list_arbitrary_waveforms(self):
         '''
@@ -609,13 +879,60 @@ class SDG2000X(VisaInstruments):
         Returns:
             List of waveform names
         '''
-        response = self.instr.query('STL?')
-        # Parse the response to extract waveform names
-        waveforms = []
-        if response:
-            # STL response format: "STL M1,SINE,M2,USER,..."
-            parts = response.replace('STL', '').strip().split(',')
-            for i in range(1, len(parts), 2):  # Skip indices, get names
-                if i < len(parts):
-                    waveforms.append(parts[i].strip())
-        return waveforms
\ No newline at end of file
+        response = self._stl()
+        # STL response format: "STL M1,SINE,M2,USER,..." - the names sit
+        # at the odd positions of the payload
+        if not response:
+            return []
+        _, _, payload = response.partition(' ')
+        return [f.strip() for f in payload.split(',')][1::2]
+
+# The single-parameter setters (set_waveform, set_wave_frequency, ...) were
+# literal copies differing only in the BSWV token, so they are generated from
+# this table instead: method name -> (SCPI token, docstring subject, arg doc)
+_SETTERS = {
+    'set_waveform': ('WVTP', 'waveform',
+                     'type: type of waveform (SINE, SQUARE, RAMP, PULSE, NOISE, DC, ARB)'),
+    'set_wave_frequency': ('FRQ', 'frequency', 'frequency: wave frequency (Hz)'),
+    'set_wave_period': ('PERI', 'period', 'period: wave period (s)'),
+    'set_wave_amplitude': ('AMP', 'amplitude', 'amplitude: wave amplitude (V)'),
+    'set_wave_offset': ('OFST', 'offset', 'offset: wave offset (V)'),
+    'set_wave_symmetry': ('SYM', 'symmetry', 'symmetry: wave symmetry (%)'),
+    'set_wave_duty': ('DUTY', 'duty', 'duty: wave duty (%)'),
+    'set_wave_phase': ('PHSE', 'phase', 'phase: wave phase (°)'),
+    'set_wave_stdev': ('STDEV', 'stdev', 'stdev: wave stdev (V)'),
+    'set_wave_mean': ('MEAN', 'mean', 'mean: wave mean (V)'),
+    'set_wave_width': ('WIDTH', 'width', 'width: wave width (s)'),
+    'set_wave_rise': ('RISE', 'rise', 'rise: wave rise (s)'),
+    'set_wave_fall': ('FALL', 'fall', 'fall: wave fall (s)'),
+    'set_wave_delay': ('DLY', 'delay', 'delay: wave delay (s)'),
+    'set_wave_high_level': ('HLEV', 'high_level', 'high_level: wave high_level (V)'),
+    'set_wave_low_level': ('LLEV', 'low_level', 'low_level: wave low_level (V)')
+}
+
+
+def _make_setter(name, tag, subject, arg_doc):
+    # the interned channel prefix is looked up and concatenated to a
+    # %-formatted tail, so only the value is formatted per call
+    fmt = (tag + ',%s').__mod__
+
+    def setter(self, channel, value):
+        self._cache.pop((channel, 'BSWV'), None)
+        self._enqueue((channel, 'BSWV', tag), _BSWV_PREFIX[channel] + fmt(value))
+
+    setter.__name__ = name
+    setter.__qualname__ = f'SDG2000X.{name}'
+    setter.__doc__ = (
+        f'\n        Can set {subject} of set channel\n'
+        f'\n'
+        f'        Args:\n'
+        f'        channel: the set channel (C1, C2)\n'
+        f'        {arg_doc}\n'
+        f'        '
+    )
+    return setter
+
+
+for _name, (_tag, _subject, _arg_doc) in _SETTERS.items():
+    setattr(SDG2000X, _name, _make_setter(_name, _tag, _subject, _arg_doc))
+del _name, _tag, _subject, _arg_doc
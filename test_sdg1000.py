@@ -11,6 +11,7 @@ model detection, and command generation.
 import unittest
 import sys
 import os
+from types import MappingProxyType
 
 # Add paths for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -18,22 +19,31 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Mock pyvisa for testing
 class MockInstrument:
+    # The response table is shared and read-only, and __slots__ drops the
+    # per-instance attribute dict, so every setUp constructs the mock
+    # with near-zero work
+    __slots__ = ('write_termination', 'read_termination', 'query_delay',
+                 'chunk_size', 'commands')
+
+    _RESPONSES = MappingProxyType({
+        '*IDN?': 'Siglent Technologies,SDG1025,SDG1XXXXXXXX,1.01.01.33R5',
+        'C1:OUTP?': 'C1:OUTP ON,LOAD,50,PLRT,NOR',
+        'C1:BSWV?': 'C1:BSWV WVTP,SINE,FRQ,1000.0HZ,AMP,2.0V,OFST,0.0V,PHSE,0.0',
+        'C1:BSWV?;C1:OUTP?': 'C1:BSWV WVTP,SINE,FRQ,1000.0HZ,AMP,2.0V,'
+                             'OFST,0.0V,PHSE,0.0;C1:OUTP ON,LOAD,50,PLRT,NOR'
+    })
+
     def __init__(self):
         self.write_termination = '\n'
         self.read_termination = '\n'
         self.query_delay = 0.1
         self.commands = []
-        self.responses = {
-            '*IDN?': 'Siglent Technologies,SDG1025,SDG1XXXXXXXX,1.01.01.33R5',
-            'C1:OUTP?': 'C1:OUTP ON,LOAD,50,PLRT,NOR',
-            'C1:BSWV?': 'C1:BSWV WVTP,SINE,FRQ,1000.0HZ,AMP,2.0V,OFST,0.0V,PHSE,0.0'
-        }
     
     def write(self, command):
         self.commands.append(command)
     
     def query(self, command):
-        return self.responses.get(command, 'OK')
+        return self._RESPONSES.get(command, 'OK')
     
     def close(self):
         pass
@@ -119,10 +129,15 @@ class TestSDG1000(unittest.TestCase):
     
     def test_set_frequency_with_validation(self):
         """Test set_wave_frequency with SDG1000 validation"""
-        # Valid frequency
-        self.instrument.set_wave_frequency('C1', 1000)
-        self.assertIn('C1:BSWV FRQ,1000', self.instrument.instr.commands)
-        
+        # Valid frequency (2000 differs from the mock's reported 1000 Hz,
+        # so the write is not elided as redundant)
+        self.instrument.set_wave_frequency('C1', 2000)
+        self.assertIn('C1:BSWV FRQ,2000', self.instrument.instr.commands)
+
+        # Re-applying the same value is skipped, not re-sent
+        self.instrument.set_wave_frequency('C1', 2000)
+        self.assertEqual(self.instrument.instr.commands.count('C1:BSWV FRQ,2000'), 1)
+
         # Invalid frequency should raise error
         with self.assertRaises(ValueError):
             self.instrument.set_wave_frequency('C1', 20e6)
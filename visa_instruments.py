@@ -9,48 +9,324 @@ Class to manage visa instruments
 @contact: francesco.gramazio@lab3841.it
 '''
 
+import re
+import time
+from contextlib import contextmanager
+from typing import Optional
+
 import pyvisa
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# The three leading *IDN? fields never contain commas; the trailing
+# group keeps firmware strings that do
+_IDN_RE = re.compile(r'([^,]+),([^,]+),([^,]+),(.+)')
+
+# One ResourceManager shared process-wide: constructing one triggers
+# backend discovery and library init, which multi-instrument setups
+# would otherwise pay once per session
+_RM = None
+
+
+def _get_rm():
+    '''Returns the shared ResourceManager, creating it on first use'''
+    global _RM
+    if _RM is None:
+        _RM = pyvisa.ResourceManager()
+    return _RM
+
+
 class VisaInstruments():
-    def __init__(self, address: str):
-        self.rm = pyvisa.ResourceManager()
-        
+    # Slots for every attribute the wrapper family uses. The subclasses
+    # declare empty __slots__ so all layouts stay identical, which the
+    # factory's in-place __class__ specialization requires; their extra
+    # state (snapshot, reply cache, bound fast paths, write queue) is
+    # therefore listed here. Dropping the per-instance dict shrinks each
+    # session and speeds attribute access through slot descriptors.
+    __slots__ = ('rm', 'address', '_query_delay', '_timeout', '_instr',
+                 '_idn_cache', '_pending', '_state', '_cache',
+                 '_write', '_query', '_write_q', 'model_name')
+
+    def __init__(self, address: str, query_delay: float = 0.0,
+                 timeout: Optional[float] = None):
+        self.rm = _get_rm()
+
         self.address = address
-        self.instr = self.rm.open_resource(self.address)
-        self.instr.write_termination = '\n'
-        self.instr.read_termination = '\n'
-        self.instr.query_delay = 0.1
+        self._query_delay = query_delay
+        self._timeout = timeout
+        # Opened lazily by the instr property, so building the wrapper
+        # costs nothing until the first command needs the bus
+        self._instr = None
+
+        # Parsed *IDN? reply, filled on first get_info(); the identity of
+        # an open session cannot change, so one query serves all callers
+        self._idn_cache = None
+
+        # Buffer for batch(): None when writes go out immediately, a
+        # list of queued command strings while a batch is open
+        self._pending = None
+
+    @property
+    def instr(self):
+        '''
+        The pyvisa session, opened on first access
+
+        UI code can construct wrappers up front and connect later; the
+        backend discovery and session negotiation run only when the
+        first command actually needs the bus
+        '''
+        if self._instr is None:
+            self._instr = self._open()
+            self._on_open()
+        return self._instr
+
+    def _on_open(self):
+        '''
+        Hook run right after a session opens (also after reconnect);
+        subclasses tune the transport or re-bind methods here
+        '''
+
+    def _post_rebind(self):
+        '''
+        Hook run by the factory after specializing a detection session
+        in place with a __class__ assignment; subclasses initialize the
+        per-instance state their own __init__ would have set up
+        '''
+
+    def open(self):
+        '''
+        Opens the session now instead of waiting for the first command
+        '''
+        self.instr
+
+    def _open(self):
+        '''
+        Opens the resource and applies the session attributes; used by
+        __init__ and again by reconnect()
+        '''
+        instr = self.rm.open_resource(self.address)
+        instr.write_termination = '\n'
+        instr.read_termination = '\n'
+        # No artificial write-to-read delay by default: SDG devices on
+        # Ethernet/USB answer as soon as the reply is ready, so the old
+        # fixed 0.1 s was 100 ms of dead time on every query. Pass a
+        # non-zero query_delay for buses that need a settling gap.
+        instr.query_delay = self._query_delay
+        if self._timeout is not None:
+            instr.timeout = self._timeout
+        if 'GPIB' in self.address:
+            # pyvisa-py's GPIB defaults can mis-handle EOI and leave a
+            # read waiting out the whole timeout; asserting EOI on write
+            # keeps reads terminating on the message end instead
+            instr.send_end = True
+        # The default chunk_size makes long replies (STL?, arb blocks)
+        # loop over ~20 KB low-level reads; 100 KiB moves them in one
+        instr.chunk_size = 102400
+        if self.address.startswith('TCPIP'):
+            # TCP keepalive stops idle LAN sessions from being dropped
+            # silently by NAT or the instrument; backends without the
+            # attribute simply skip it
+            try:
+                instr.set_visa_attribute(
+                    pyvisa.constants.VI_ATTR_TCPIP_KEEPALIVE, True)
+            except Exception:
+                pass
+        return instr
+
+    def reconnect(self, retries: int = 3, backoff: float = 0.5):
+        '''
+        Rebuilds the session after a dropped connection
+
+        Re-opening reuses the shared ResourceManager, so only the TCP
+        handshake is paid. Attempts are spaced with exponential backoff
+        (backoff, 2x, 4x, ...) to give a rebooting instrument time to
+        come back; the last error is re-raised when every attempt fails
+        '''
+        try:
+            if self._instr is not None:
+                self._instr.close()
+        except Exception:
+            pass
+        self._instr = None
+        delay = backoff
+        for attempt in range(retries):
+            try:
+                self._instr = self._open()
+                self._on_open()
+                return
+            except Exception as error:
+                last_error = error
+                time.sleep(delay)
+                delay *= 2
+        raise last_error
 
     def get_info(self):
         ''' 
         Returns the instrument information
+
+        The parsed *IDN? reply is cached on the instance, so repeated
+        calls cost no I/O; see refresh_info()
+        '''
+        if self._idn_cache is None:
+            response = self.instr.query('*IDN?')
+            self._idn_cache = self._parse_idn(response)
+        return self._idn_cache
+
+    def refresh_info(self):
+        '''
+        Drops the cached *IDN? reply and queries the instrument again
         '''
-        response = self.instr.query('*IDN?')
-        fields = response.strip().split(',')
+        self._idn_cache = None
+        return self.get_info()
+
+    @staticmethod
+    def _parse_idn(response: str) -> dict:
+        '''
+        Parses a raw *IDN? reply into the get_info dictionary
+        '''
+        match = _IDN_RE.match(response.strip())
+        if match is None:
+            raise ValueError(f'Unexpected *IDN? reply: {response!r}')
 
         # creates a dictionary
-        instrument_dict = {
-        'device_id' : fields[0],
-        'model' : fields[1], 
-        'serial_number' : fields[2],
-        'firmware_version' : fields[3]
+        return {
+        'device_id' : match[1],
+        'model' : match[2], 
+        'serial_number' : match[3],
+        'firmware_version' : match[4]
         }
-        
-        return instrument_dict
     
+    def query_floats(self, command: str):
+        '''
+        Queries an ASCII list of numbers and returns it as a numpy array
+
+        pyvisa splits and converts the reply in one pass; without numpy
+        installed a plain list of floats is returned instead
+        '''
+        if _np is not None:
+            return self.instr.query_ascii_values(command, container=_np.array)
+        return self.instr.query_ascii_values(command)
+
+    def query_block(self, command: str, datatype: str = 'h'):
+        '''
+        Queries an IEEE-488.2 definite-length binary block and returns it
+        as a numpy array (a list without numpy)
+
+        The default datatype 'h' matches the int16 samples the SDG
+        waveform commands use; no per-point Python float conversion runs
+        '''
+        if _np is not None:
+            return self.instr.query_binary_values(command, datatype=datatype,
+                                                  container=_np.array)
+        return self.instr.query_binary_values(command, datatype=datatype)
+
+    def write_batch(self, commands):
+        '''
+        Sends several SCPI commands as one ';'-chained compound write
+
+        Collapses N separate VISA transfers into a single message, so the
+        bus round trip is paid once instead of once per command
+        '''
+        if commands:
+            self.instr.write(';'.join(commands))
+
+    def begin_batch(self):
+        '''
+        Starts buffering setter writes instead of sending them immediately
+        '''
+        if self._pending is None:
+            self._pending = []
+
+    def flush(self):
+        '''
+        Sends every buffered write as a single compound SCPI message
+
+        Batch mode stays active; call it again after buffering more writes
+        '''
+        if self._pending:
+            self.write_batch(self._pending)
+            del self._pending[:]
+
+    @contextmanager
+    def batch(self):
+        '''
+        Buffers setter writes inside the block and sends them as one
+        compound write on exit:
+
+            with inst.batch():
+                inst.set_waveform(inst.CHANNEL1, inst.WAVEFORM_SINE)
+                inst.set_wave_frequency(inst.CHANNEL1, 1000)
+
+        Queries issued inside the block flush the buffer first, so
+        command ordering is preserved
+        '''
+        nested = self._pending is not None
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.flush()
+            if not nested:
+                self._pending = None
+
+    def close(self):
+        '''
+        Closes this instrument session
+
+        The shared ResourceManager stays open for other sessions; use
+        shutdown_rm() to tear that down too. A later command re-opens
+        the session through the instr property
+        '''
+        if self._instr is not None:
+            self._instr.close()
+            self._instr = None
+
+    @staticmethod
+    def shutdown_rm():
+        '''
+        Closes the shared ResourceManager (for clean teardown at the end
+        of a program or test run); the next session re-creates it
+        '''
+        global _RM
+        if _RM is not None:
+            _RM.close()
+            _RM = None
+
     def reset(self):
         '''
         Resets the instrument
         '''
+        self._idn_cache = None
         self.instr.write('*RST')
 
-    def self_test(self):
+    def self_test(self, timeout: float = 30.0, poll: float = 0.1):
         '''
         Starts a self-test to finds errors
+
+        *TST? can take seconds on SDG devices, so instead of blocking in
+        a single long read the reply is polled every `poll` seconds and
+        TimeoutError is raised once `timeout` elapses with no answer
         '''
-        response = self.instr.query('*TST?')
+        self.instr.write('*TST?')
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                waiting = self.instr.bytes_in_buffer
+            except AttributeError:
+                # Backend without buffer introspection: blocking read
+                response = self.instr.read()
+                break
+            if waiting:
+                response = self.instr.read()
+                break
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'*TST? gave no reply within {timeout} s')
+            time.sleep(poll)
 
-        if response == '0':
+        if response.strip() == '0':
             return True
         else:
             return False
@@ -0,0 +1,71 @@
+'''
+Asynchronous facade over VisaInstruments
+
+@version: v0.1.0
+
+@requires: pip install pyvisa
+
+@author: Thomas Blum (tfblum)
+'''
+
+import asyncio
+
+from visa_instruments import VisaInstruments
+
+
+class AsyncVisaInstruments():
+    '''
+    Wraps a synchronous instrument session so its methods can be awaited
+
+    Attribute lookups that resolve to a callable on the wrapped session
+    come back as coroutine functions that run the call in a worker
+    thread via asyncio.to_thread. pyvisa releases the GIL inside the
+    underlying viRead/viWrite, so several instruments driven through
+    asyncio.gather overlap their bus round trips instead of paying
+    N sequential round-trip times:
+
+        insts = [AsyncVisaInstruments(addr) for addr in addresses]
+        infos = await asyncio.gather(*[inst.get_info() for inst in insts])
+
+    Calls on ONE wrapped session must still be awaited in order — the
+    instrument itself is serial — but calls on different sessions run
+    concurrently.
+    '''
+
+    def __init__(self, address: str = None, session: VisaInstruments = None):
+        '''
+        Opens a plain VisaInstruments session on the address, or wraps
+        an already open session (e.g. one built by the factory) so its
+        subclass methods become awaitable too
+        '''
+        if session is None:
+            session = VisaInstruments(address)
+        self.session = session
+
+    def __getattr__(self, name):
+        attr = getattr(self.session, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+    @staticmethod
+    async def gather_info(instruments):
+        '''
+        Queries the instrument information of every session concurrently
+        and returns the list of get_info dictionaries in input order
+
+        Accepts a mix of AsyncVisaInstruments and plain synchronous
+        sessions; the latter are pushed to worker threads here
+        '''
+        tasks = []
+        for instrument in instruments:
+            if isinstance(instrument, AsyncVisaInstruments):
+                tasks.append(instrument.get_info())
+            else:
+                tasks.append(asyncio.to_thread(instrument.get_info))
+        return await asyncio.gather(*tasks)